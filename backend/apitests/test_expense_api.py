@@ -115,7 +115,7 @@ def test_expense_endpoints():
     print("\n📋 Step 3: Retrieve Expenses")
     
     try:
-        response = requests.get(f"{BASE_URL}/expenses", headers=headers)
+        response = requests.get(f"{BASE_URL}/expenses?include_total=true", headers=headers)
         if response.status_code == 200:
             expenses_data = response.json()
             expenses = expenses_data["data"]
@@ -126,6 +126,54 @@ def test_expense_endpoints():
     except Exception as e:
         print(f"❌ Error retrieving expenses: {e}")
     
+    # Step 3b: Test cursor pagination
+    print("\n📑 Step 3b: Paginate Expenses")
+    
+    try:
+        # Walk every page with next_cursor and compare against the counted total
+        response = requests.get(f"{BASE_URL}/expenses?limit=2&include_total=true", headers=headers)
+        page = response.json()
+        total = page["meta"]["total"]
+        seen_ids = [expense["id"] for expense in page["data"]]
+        while page["meta"]["next_cursor"]:
+            response = requests.get(
+                f"{BASE_URL}/expenses?limit=2&cursor={page['meta']['next_cursor']}",
+                headers=headers,
+            )
+            page = response.json()
+            seen_ids.extend(expense["id"] for expense in page["data"])
+        if len(seen_ids) == total and len(set(seen_ids)) == total:
+            print(f"✅ Cursor walk returned all {total} expenses without duplicates")
+        else:
+            print(f"❌ Cursor walk returned {len(seen_ids)} rows ({len(set(seen_ids))} unique), expected {total}")
+        
+        # The last page carries no cursor
+        if page["meta"]["next_cursor"] is None and len(page["data"]) <= 2:
+            print("✅ Last page has no next_cursor")
+        else:
+            print(f"❌ Unexpected last page meta: {page['meta']}")
+        
+        # A malformed cursor is rejected
+        response = requests.get(f"{BASE_URL}/expenses?cursor=not-a-cursor", headers=headers)
+        if response.status_code == 400:
+            print("✅ Invalid cursor rejected with 400")
+        else:
+            print(f"❌ Invalid cursor returned {response.status_code}: {response.text}")
+        
+        # The cached total must not outlive a write
+        response = requests.get(f"{BASE_URL}/expenses?include_total=true", headers=headers)
+        cached_total = response.json()["meta"]["total"]
+        response = requests.post(f"{BASE_URL}/expenses", json=sample_expenses[0], headers=headers)
+        if response.status_code == 201:
+            created_expense_ids.append(response.json()["data"]["id"])
+        response = requests.get(f"{BASE_URL}/expenses?include_total=true", headers=headers)
+        if response.json()["meta"]["total"] == cached_total + 1:
+            print("✅ Cached total refreshed after creating an expense")
+        else:
+            print(f"❌ Total stayed at {response.json()['meta']['total']} after a write (was {cached_total})")
+    except Exception as e:
+        print(f"❌ Error paginating expenses: {e}")
+    
     # Step 4: Test expense filtering
     print("\n🔍 Step 4: Filter Expenses")
     
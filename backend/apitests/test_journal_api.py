@@ -5,8 +5,13 @@ Tests all journal endpoints with sample data
 
 import requests
 import json
+import uuid
 from datetime import datetime, timedelta
 
+from app.db.database import SessionLocal
+from app.models.models import JournalEntry, User
+from app.services.journal import JournalService
+
 
 # Configuration
 BASE_URL = "http://localhost:8000"
@@ -231,5 +236,46 @@ def test_journal_endpoints():
     print("\n🎉 Journal API tests completed!")
 
 
+def test_journal_longest_streak():
+    """Check the SQL longest-streak calculation on backdated entries.
+    
+    Entries cannot be backdated through the API, so this seeds a throwaway
+    user directly inside a transaction that is rolled back.
+    """
+    print("\n🔥 Testing longest journal streak")
+    db = SessionLocal()
+    try:
+        suffix = uuid.uuid4().hex[:12]
+        user = User(
+            username=f"streak_{suffix}",
+            email=f"streak_{suffix}@example.com",
+            first_name="Streak",
+            last_name="Test",
+            hashed_password="x",
+        )
+        db.add(user)
+        db.flush()
+        
+        # Two runs: three consecutive days, a gap, then two more days.
+        # The first day has two entries, which must count once.
+        today = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        for days_ago in (10, 10, 9, 8, 5, 4):
+            db.add(JournalEntry(
+                user_id=user.id,
+                content=f"Entry from {days_ago} days ago",
+                created_at=today - timedelta(days=days_ago),
+            ))
+        db.flush()
+        
+        stats = JournalService.get_journal_stats(db, user)
+        assert stats["total_entries"] == 6, stats
+        assert stats["longest_streak"] == 3, stats
+        print(f"✅ Longest streak: {stats['longest_streak']}")
+    finally:
+        db.rollback()
+        db.close()
+
+
 if __name__ == "__main__":
     test_journal_endpoints()
+    test_journal_longest_streak()
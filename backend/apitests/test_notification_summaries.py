@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for the daily email summary selection.
+Runs against the configured database inside a transaction that is rolled back.
+"""
+import uuid
+
+from app.db.database import SessionLocal
+from app.models.models import User, UserPreferences
+from app.services.notification_service import NotificationService
+
+
+def _add_user(db, email_enabled):
+    """Add a throwaway user with the given email opt-in setting."""
+    suffix = uuid.uuid4().hex[:12]
+    user = User(
+        username=f"summary_{suffix}",
+        email=f"summary_{suffix}@example.com",
+        first_name="Summary",
+        last_name="Test",
+        hashed_password="x",
+    )
+    db.add(user)
+    db.flush()
+    settings = None if email_enabled is None else {"email_enabled": email_enabled, "preferred_time": "08:00"}
+    db.add(UserPreferences(user_id=user.id, notification_settings=settings))
+    db.flush()
+    return user
+
+
+def test_daily_email_summaries_only_include_opted_in_users():
+    """Only users with email_enabled set to true get a summary."""
+    print("\n" + "=" * 60)
+    print("TEST: Daily email summaries filter on email_enabled")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        opted_in = _add_user(db, True)
+        opted_out = _add_user(db, False)
+        no_settings = _add_user(db, None)
+
+        summaries = NotificationService.get_daily_email_summaries(db)
+
+        assert opted_in.id in summaries
+        assert opted_out.id not in summaries
+        assert no_settings.id not in summaries
+        print("  ✓ Opted-in user included; opted-out and unset users skipped")
+
+        # The bulk path returns the same figures as the single-user summary
+        single = NotificationService.get_daily_summary(db, opted_in)
+        assert summaries[opted_in.id].model_dump() == single.model_dump()
+        print("  ✓ Bulk summary matches the single-user summary")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    test_daily_email_summaries_only_include_opted_in_users()
@@ -43,6 +43,18 @@ class Settings(BaseSettings):
     daily_update_rate_limit_requests: int = 2
     daily_update_rate_limit_window_seconds: int = 60
 
+    # Read expense summaries from expense_rollup (see sql/expense_rollup_migration.sql)
+    expense_rollup_enabled: bool = False
+    # Per-process cache of expense counts and summaries. Writes only invalidate
+    # it in the worker that handled them, so with several workers the others
+    # may serve totals up to 30 s old; disable it when that is not acceptable.
+    expense_cache_enabled: bool = True
+
+    # Buffer size for copying uploaded files to disk
+    upload_copy_buffer_bytes: int = 1024 * 1024
+    # Files saved at once by upload_multiple_images
+    upload_concurrency: int = 8
+
     # Email Configuration (Optional)
     smtp_host: Optional[str] = None
     smtp_port: Optional[int] = None
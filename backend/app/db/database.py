@@ -1,3 +1,4 @@
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -8,6 +9,11 @@ from app.core.config import settings
 # Use database_url property which handles both Supabase and direct PostgreSQL
 DATABASE_URL = settings.database_url
 
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Establish a connection to the PostgreSQL database
 engine = create_engine(
     DATABASE_URL,
@@ -16,6 +22,9 @@ engine = create_engine(
     pool_size=5,             # Number of connections to maintain
     max_overflow=10,         # Max connections beyond pool_size
     pool_timeout=30,         # Timeout for getting connection from pool
+    query_cache_size=1200,   # Compiled SQL cache; filter/lambda_stmt variants outgrow the default 500
+    json_serializer=_json_serializer,  # orjson for JSON/JSONB columns
+    json_deserializer=orjson.loads,
     connect_args={
         "connect_timeout": 10,
         "keepalives": 1,
@@ -28,7 +37,6 @@ engine = create_engine(
 print(DATABASE_URL)
 
 Base = declarative_base()
-Base.metadata.create_all(engine)
 
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import calendar
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import List, Optional
 from uuid import UUID
 
@@ -18,6 +19,21 @@ from app.schemas.events import (
     EventUpdate,
 )
 from app.services.ai_rate_limit import ai_rate_limit
+from app.services.ai_service import ai_service
+
+
+@lru_cache(maxsize=2048)
+def _parse_tags(raw: str) -> tuple:
+    """Decode a serialized tag list.
+
+    Month views repeat the same few tag strings across many events, so the
+    decoded result is cached; it is a tuple so callers cannot mutate it.
+    """
+    try:
+        tags = json.loads(raw)
+    except json.JSONDecodeError:
+        return ()
+    return tuple(tags) if isinstance(tags, list) else ()
 
 
 class EventFacade:
@@ -44,6 +60,7 @@ class EventFacade:
         page: int = 1,
         limit: int = 50,
     ) -> dict:
+        now = datetime.now(timezone.utc)
         try:
             events, total = self._repository.list_events(
                 self._user.id,
@@ -55,45 +72,14 @@ class EventFacade:
                 limit=limit,
             )
 
-            event_data = []
-            for event in events:
-                # Handle tags parsing safely
-                tags_parsed = []
-                if event.tags:
-                    try:
-                        if isinstance(event.tags, str):
-                            tags_parsed = json.loads(event.tags)
-                        elif isinstance(event.tags, list):
-                            tags_parsed = event.tags
-                    except (json.JSONDecodeError, TypeError, AttributeError):
-                        tags_parsed = []
-                
-                event_dict = {
-                    "id": event.id,
-                    "user_id": event.user_id,
-                    "title": event.title,
-                    "description": event.description,
-                    "start_time": event.start_time,
-                    "end_time": event.end_time,
-                    "location": event.location,
-                    "tags": tags_parsed,
-                    "is_all_day": event.is_all_day,
-                    "reminder_minutes": event.reminder_minutes,
-                    "recurrence_rule": event.recurrence_rule,
-                    "color": event.color,
-                    "created_at": event.created_at,
-                    "updated_at": event.updated_at,
-                }
-                event_data.append(event_dict)
-
             return {
-                "data": event_data,
+                "data": events,
                 "meta": {
                     "total": total,
                     "page": page,
                     "limit": limit,
                     "pages": (total + limit - 1) // limit,
-                    "timestamp": datetime.utcnow(),
+                    "timestamp": now,
                 },
             }
         except Exception as e:
@@ -135,26 +121,25 @@ class EventFacade:
         return {"data": EventOut.model_validate(event)}
 
     def update_event(self, event_id: UUID, event_data: EventUpdate) -> dict:
-        event = self._repository.get_by_id(self._user.id, event_id)
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Event not found",
-            )
         update_data = event_data.model_dump(exclude_unset=True)
         if "tags" in update_data:
             update_data["tags"] = (
                 json.dumps(update_data["tags"]) if update_data["tags"] else None
             )
         try:
-            updated = self._repository.update(event, update_data)
-            return {"data": EventOut.model_validate(updated)}
+            updated = self._repository.update(self._user.id, event_id, update_data)
         except Exception as exc:  # pragma: no cover
             self._repository.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to update event: {exc}",
             ) from exc
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found",
+            )
+        return {"data": EventOut.model_validate(updated)}
 
     def delete_event(self, event_id: UUID) -> dict:
         event = self._repository.get_by_id(self._user.id, event_id)
@@ -187,18 +172,16 @@ class EventFacade:
             "events": [],
             "events_by_date": {},
         }
+        events_list = calendar_data["events"]
+        events_by_date = calendar_data["events_by_date"]
         for event in events:
             # Handle tags parsing safely
-            tags = []
-            if event.tags:
-                try:
-                    if isinstance(event.tags, str):
-                        tags = json.loads(event.tags)
-                    elif isinstance(event.tags, list):
-                        tags = event.tags
-                except (json.JSONDecodeError, TypeError):
-                    tags = []
-            
+            tags = event.tags
+            if isinstance(tags, str):
+                tags = list(_parse_tags(tags)) if tags else []
+            elif not isinstance(tags, list):
+                tags = []
+
             event_dict = {
                 "id": event.id,
                 "title": event.title,
@@ -210,53 +193,24 @@ class EventFacade:
                 "is_all_day": event.is_all_day,
                 "color": event.color,
             }
-            calendar_data["events"].append(event_dict)
-            event_date = event.start_time.date().isoformat()
-            calendar_data.setdefault("events_by_date", {}).setdefault(event_date, []).append(event_dict)
+            events_list.append(event_dict)
+            start = event.start_time
+            date_key = f"{start.year:04d}-{start.month:02d}-{start.day:02d}"
+            events_by_date.setdefault(date_key, []).append(event_dict)
         return {"data": calendar_data}
 
     def get_upcoming_events(self, days: int = 7) -> dict:
-        events = self._repository.upcoming(self._user.id, days)
-        event_data = []
-        for event in events:
-            # Handle tags parsing safely
-            tags = []
-            if event.tags:
-                try:
-                    if isinstance(event.tags, str):
-                        tags = json.loads(event.tags)
-                    elif isinstance(event.tags, list):
-                        tags = event.tags
-                except (json.JSONDecodeError, TypeError):
-                    tags = []
-            
-            event_dict = {
-                "id": event.id,
-                "user_id": event.user_id,
-                "title": event.title,
-                "description": event.description,
-                "start_time": event.start_time,
-                "end_time": event.end_time,
-                "location": event.location,
-                "tags": tags,
-                "is_all_day": event.is_all_day,
-                "reminder_minutes": event.reminder_minutes,
-                "recurrence_rule": event.recurrence_rule,
-                "color": event.color,
-                "created_at": event.created_at,
-                "updated_at": event.updated_at,
-            }
-            event_data.append(event_dict)
-        start_date = datetime.now()
+        start_date = datetime.now(timezone.utc)
         end_date = start_date + timedelta(days=days)
+        events = self._repository.upcoming(self._user.id, start_date, end_date)
         return {
-            "data": event_data,
+            "data": events,
             "meta": {
-                "total": len(event_data),
+                "total": len(events),
                 "days": days,
                 "start_date": start_date,
                 "end_date": end_date,
-                "timestamp": datetime.utcnow(),
+                "timestamp": start_date,
             },
         }
 
@@ -291,8 +245,6 @@ class EventFacade:
     # ------------------------------------------------------------------
     @ai_rate_limit(feature="events:parse_text", key_func=lambda self, *_, **__: self._user_key())
     async def parse_text_with_ai(self, text: str) -> AIEventParseResponse:
-        from app.services.ai_service import ai_service
-
         ai_result = await ai_service.parse_text_event(text)
         if not ai_result.get("is_event_related", True):
             return AIEventParseResponse(
@@ -318,8 +270,6 @@ class EventFacade:
 
     @ai_rate_limit(feature="events:parse_voice", key_func=lambda self, *_, **__: self._user_key())
     async def parse_voice_with_ai(self, file: UploadFile) -> AIEventParseResponse:
-        from app.services.ai_service import ai_service
-
         ai_result = await ai_service.parse_voice_event(file)
         if not ai_result.get("is_event_related", True):
             return AIEventParseResponse(
@@ -1,34 +1,59 @@
 """Facade for orchestrating expense workflows."""
 from __future__ import annotations
 
+import base64
 import calendar
 import csv
 import io
 import json
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
 from uuid import UUID
 
+import orjson
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy import String, cast, func
+from sqlalchemy.orm import Session
 
+from app.db.database import SessionLocal
 from app.models.models import Expense, User
-from app.repositories.expense_repository import ExpenseRepository
+from app.repositories.expense_repository import ExpenseCursor, ExpenseRepository
 from app.schemas.expenses import (
     CategoryBreakdownItem,
     CategorySummary,
     CategoryTrendMonth,
+    ExpenseBulkImport,
+    ExpenseCategory,
     ExpenseCreate,
     ExpenseOut,
     ExpenseSummary,
     ExpenseUpdate,
     MonthlyExpense,
+    PaymentMethod,
     SpendTrendData,
     TopTransactionData,
     TotalSpendData,
 )
 from app.utils.upload import upload_receipt_image
 from app.services.ai_rate_limit import ai_rate_limit
+from app.services.ai_service import ai_service
+
+
+EXPORT_CSV_HEADER = [
+    "ID",
+    "Amount",
+    "Currency",
+    "Category",
+    "Subcategory",
+    "Merchant",
+    "Description",
+    "Date",
+    "Payment Method",
+    "Is Recurring",
+    "Tags",
+    "Created At",
+]
+EXPORT_BATCH_SIZE = 500
 
 
 def _facade_user_key(instance, *_args, **_kwargs) -> str:
@@ -38,6 +63,125 @@ def _facade_user_key(instance, *_args, **_kwargs) -> str:
     return f"user:{user_id}"
 
 
+def _shift_month(year: int, month: int, months: int) -> tuple[int, int]:
+    """Return the (year, month) that is ``months`` months away (may be negative)."""
+    years, month_index = divmod(month - 1 + months, 12)
+    return year + years, month_index + 1
+
+
+def _same_day_months_ago(now: datetime, months: int) -> datetime:
+    """Return ``now``'s date ``months`` months earlier, clamping the day to that month."""
+    year, month = _shift_month(now.year, now.month, -months)
+    day = min(now.day, calendar.monthrange(year, month)[1])
+    return datetime(year, month, day)
+
+
+def _dashboard_now() -> datetime:
+    """Return the current time truncated to the minute.
+
+    Dashboard ranges derived from it stay identical for a minute, so the
+    repository's per-user dashboard cache can actually be hit.
+    """
+    return datetime.now().replace(second=0, microsecond=0)
+
+
+def _end_of_day(moment: datetime) -> datetime:
+    return moment.replace(hour=23, minute=59, second=59, microsecond=999_999)
+
+
+@lru_cache(maxsize=8)
+def _month_bounds(year: int, month: int) -> tuple[datetime, datetime, datetime]:
+    """Return (month start, month end, previous month start) for a calendar month.
+
+    The dashboards ask for the same month on nearly every request, so the
+    boundaries are computed once per (year, month) and reused.
+    """
+    _, last_day = calendar.monthrange(year, month)
+    return (
+        datetime(year, month, 1),
+        datetime(year, month, last_day, 23, 59, 59, 999_999),
+        datetime(*_shift_month(year, month, -1), 1),
+    )
+
+
+def _format_iso_week(week_start: datetime) -> str:
+    """Format a ``date_trunc('week', ...)`` bucket as ``YYYY-Www``."""
+    iso_year, iso_week, _ = week_start.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+def _format_month(month_start: datetime) -> str:
+    """Format a ``date_trunc('month', ...)`` bucket as ``YYYY-MM``."""
+    return month_start.strftime("%Y-%m")
+
+
+def _encode_cursor(key: ExpenseCursor) -> str:
+    """Serialize a list sort key into an opaque, URL-safe cursor."""
+    is_today, date, created_at, expense_id = key
+    raw = json.dumps([is_today, date.isoformat(), created_at.isoformat(), str(expense_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> ExpenseCursor:
+    """Parse a cursor produced by :func:`_encode_cursor`."""
+    try:
+        is_today, date, created_at, expense_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return (
+            int(is_today),
+            datetime.fromisoformat(date),
+            datetime.fromisoformat(created_at),
+            UUID(expense_id),
+        )
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
+def _normalize_tags(tags) -> list:
+    """Mirror ``ExpenseOut.parse_tags`` for the raw column value."""
+    if isinstance(tags, (bytes, str)):
+        try:
+            return orjson.loads(tags)
+        except orjson.JSONDecodeError:
+            return []
+    if isinstance(tags, dict):
+        value = tags.get("tags")
+        return value if isinstance(value, list) else []
+    return tags or []
+
+
+def _expense_to_out(expense) -> ExpenseOut:
+    """Build an ``ExpenseOut`` from a loaded row without running validation.
+
+    Rows come straight from our own table, so their types already match the
+    schema; ``model_construct`` skips the per-field validator chain that
+    ``model_validate`` would run for every row of a list. Only the enum and
+    tag columns need converting. User-supplied input still goes through
+    ``model_validate``. ``expense`` may be an ``Expense`` instance or a Core
+    row selecting the same columns.
+    """
+    return ExpenseOut.model_construct(
+        id=expense.id,
+        user_id=expense.user_id,
+        amount=expense.amount,
+        currency=expense.currency,
+        category=ExpenseCategory(expense.category),
+        subcategory=expense.subcategory,
+        merchant=expense.merchant,
+        description=expense.description,
+        date=expense.date,
+        payment_method=PaymentMethod(expense.payment_method) if expense.payment_method else None,
+        receipt_url=expense.receipt_url,
+        is_recurring=expense.is_recurring,
+        recurrence_rule=expense.recurrence_rule,
+        tags=_normalize_tags(expense.tags),
+        created_at=expense.created_at,
+        updated_at=expense.updated_at,
+    )
+
+
 class ExpenseFacade:
     """Coordinates repository calls and ancillary validation for expenses."""
 
@@ -45,6 +189,20 @@ class ExpenseFacade:
         self._repository = repository
         self._user = user
 
+    @classmethod
+    def for_session(cls, db: Session, user: User) -> "ExpenseFacade":
+        """Return the facade cached on ``db.info`` for this user.
+
+        ``Session.info`` lives exactly as long as the request-scoped session,
+        so repeated lookups within one request reuse a single repository and
+        facade pair.
+        """
+        cache = db.info.setdefault("_expense_facades", {})
+        facade = cache.get(user.id)
+        if facade is None:
+            facade = cache[user.id] = cls(ExpenseRepository(db), user)
+        return facade
+
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
@@ -59,8 +217,10 @@ class ExpenseFacade:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> dict:
-        expenses, total_count = self._repository.list_expenses(
+        expenses, total_count, next_key = self._repository.list_expenses(
             self._user.id,
             start_date=start_date,
             end_date=end_date,
@@ -70,52 +230,33 @@ class ExpenseFacade:
             search=search,
             page=page,
             limit=limit,
+            after=_decode_cursor(cursor) if cursor else None,
+            include_total=include_total,
         )
 
-        expense_list = []
-        for expense in expenses:
-            expense_dict = ExpenseOut.model_validate(expense).model_dump()
-            if expense.tags:
-                if isinstance(expense.tags, str):
-                    try:
-                        expense_dict["tags"] = json.loads(expense.tags)
-                    except json.JSONDecodeError:
-                        expense_dict["tags"] = []
-                else:
-                    expense_dict["tags"] = expense.tags
-            else:
-                expense_dict["tags"] = []
-            expense_list.append(expense_dict)
+        expense_list = [_expense_to_out(expense) for expense in expenses]
+
+        meta = {
+            "page": page,
+            "limit": limit,
+            "next_cursor": _encode_cursor(next_key) if next_key else None,
+        }
+        if total_count is not None:
+            meta["total"] = total_count
+            meta["pages"] = (total_count + limit - 1) // limit
 
         return {
             "success": True,
             "data": expense_list,
             "message": f"Retrieved {len(expense_list)} expenses",
-            "meta": {
-                "page": page,
-                "limit": limit,
-                "total": total_count,
-                "pages": (total_count + limit - 1) // limit,
-            },
+            "meta": meta,
         }
 
     
     
     def create_expense(self, expense_data: ExpenseCreate) -> dict:
         try:
-            payload = {
-                "amount": expense_data.amount,
-                "currency": "Taka",
-                "category": expense_data.category,
-                "subcategory": expense_data.subcategory,
-                "merchant": expense_data.merchant,
-                "description": expense_data.description,
-                "date": expense_data.date,
-                "payment_method": expense_data.payment_method,
-                "is_recurring": expense_data.is_recurring,
-                "recurrence_rule": expense_data.recurrence_rule,
-                "tags": json.dumps(expense_data.tags) if expense_data.tags else None,
-            }
+            payload = self._create_payload(expense_data)
 
             expense = self._repository.create(self._user.id, payload)
             
@@ -133,8 +274,42 @@ class ExpenseFacade:
                 detail=f"Failed to create expense: {exc}",
             ) from exc
 
-    
-    
+    def bulk_import_expenses(self, bulk_data: ExpenseBulkImport) -> dict:
+        """Insert all expenses in a single multi-row INSERT and commit once."""
+        try:
+            expenses = self._repository.bulk_create(
+                self._user.id,
+                [self._create_payload(item) for item in bulk_data.expenses],
+            )
+        except Exception as exc:
+            self._repository.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to import expenses: {exc}",
+            ) from exc
+
+        return {
+            "success": True,
+            "data": [_expense_to_out(expense) for expense in expenses],
+            "message": f"Imported {len(expenses)} expenses",
+        }
+
+    @staticmethod
+    def _create_payload(expense_data: ExpenseCreate) -> dict:
+        return {
+            "amount": expense_data.amount,
+            "currency": "Taka",
+            "category": expense_data.category,
+            "subcategory": expense_data.subcategory,
+            "merchant": expense_data.merchant,
+            "description": expense_data.description,
+            "date": expense_data.date,
+            "payment_method": expense_data.payment_method,
+            "is_recurring": expense_data.is_recurring,
+            "recurrence_rule": expense_data.recurrence_rule,
+            "tags": expense_data.tags or None,
+        }
+
     def get_expense(self, expense_id: UUID) -> dict:
         expense = self._repository.get_by_id(self._user.id, expense_id)
         if not expense:
@@ -149,56 +324,50 @@ class ExpenseFacade:
         }
 
     def update_expense(self, expense_id: UUID, expense_data: ExpenseUpdate) -> dict:
-        expense = self._repository.get_by_id(self._user.id, expense_id)
-        if not expense:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Expense not found",
-            )
-
         update_data = expense_data.model_dump(exclude_unset=True)
         if "tags" in update_data:
-            update_data["tags"] = (
-                json.dumps(update_data["tags"]) if update_data["tags"] else None
-            )
+            update_data["tags"] = update_data["tags"] or None
         if "currency" in update_data:
             update_data["currency"] = "Taka"
 
         try:
-            updated = self._repository.update(expense, update_data)
-            return {
-                "success": True,
-                "data": ExpenseOut.model_validate(updated),
-                "message": "Expense updated successfully",
-            }
+            updated = self._repository.update(self._user.id, expense_id, update_data)
         except Exception as exc:  # pragma: no cover - defensive rollback
             self._repository.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to update expense: {exc}",
             ) from exc
-
-    def delete_expense(self, expense_id: UUID) -> dict:
-        expense = self._repository.get_by_id(self._user.id, expense_id)
-        if not expense:
+        if updated is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Expense not found",
             )
+        return {
+            "success": True,
+            "data": _expense_to_out(updated),
+            "message": "Expense updated successfully",
+        }
 
+    def delete_expense(self, expense_id: UUID) -> dict:
         try:
-            deleted = self._repository.delete(expense)
-            return {
-                "success": True,
-                "data": ExpenseOut.model_validate(deleted),
-                "message": "Expense deleted successfully",
-            }
+            deleted = self._repository.delete(self._user.id, expense_id)
         except Exception as exc:  # pragma: no cover - defensive rollback
             self._repository.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete expense",
             ) from exc
+        if deleted is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Expense not found",
+            )
+        return {
+            "success": True,
+            "data": _expense_to_out(deleted),
+            "message": "Expense deleted successfully",
+        }
 
     # ------------------------------------------------------------------
     # Aggregations and summaries
@@ -209,13 +378,13 @@ class ExpenseFacade:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> dict:
-        expenses = self._repository.list_between_dates(
+        total_amount, total_count, first_date, last_date = self._repository.summary_totals(
             self._user.id,
             start_date=start_date,
             end_date=end_date,
         )
 
-        if not expenses:
+        if not total_count:
             return {
                 "success": True,
                 "data": ExpenseSummary(
@@ -229,40 +398,30 @@ class ExpenseFacade:
                 "message": "No expenses found for the specified period",
             }
 
-        total_amount = sum(expense.amount for expense in expenses)
-        total_count = len(expenses)
-        average_amount = total_amount / total_count if total_count else 0
-
-        category_totals = {}
-        for expense in expenses:
-            category_totals.setdefault(
-                expense.category,
-                {"amount": 0.0, "count": 0},
-            )
-            category_totals[expense.category]["amount"] += expense.amount
-            category_totals[expense.category]["count"] += 1
-
+        rows = self._repository.category_breakdown(
+            self._user.id,
+            start_date=start_date,
+            end_date=end_date,
+        )
         categories = [
             CategorySummary(
                 category=category,
-                total_amount=values["amount"],
-                count=values["count"],
-                percentage=round((values["amount"] / total_amount) * 100, 2)
+                total_amount=category_amount,
+                count=category_count,
+                percentage=round((category_amount / total_amount) * 100, 2)
                 if total_amount
                 else 0,
             )
-            for category, values in category_totals.items()
+            for category, category_amount, category_count in rows
         ]
 
-        categories.sort(key=lambda x: x.total_amount, reverse=True)
-
         summary = ExpenseSummary(
             total_amount=total_amount,
             total_count=total_count,
-            average_amount=round(average_amount, 2),
+            average_amount=round(total_amount / total_count, 2),
             categories=categories,
-            period_start=start_date or min(expense.date for expense in expenses),
-            period_end=end_date or max(expense.date for expense in expenses),
+            period_start=start_date or first_date,
+            period_end=end_date or last_date,
         )
 
         return {
@@ -272,26 +431,17 @@ class ExpenseFacade:
         }
 
     def get_categories_summary(self) -> dict:
-        categories = self._repository.category_breakdown(
-            self._user.id,
-            start_date=datetime.min,
-            end_date=datetime.max,
-        )
+        categories = self._repository.category_shares(self._user.id)
 
-        total_amount = sum(float(cat[1]) for cat in categories)
         category_summaries = [
             CategorySummary(
                 category=category,
-                total_amount=float(total_amount_value),
+                total_amount=total_amount_value,
                 count=transaction_count,
-                percentage=
-                round((float(total_amount_value) / total_amount) * 100, 2)
-                if total_amount
-                else 0,
+                percentage=percentage,
             )
-            for category, total_amount_value, transaction_count in categories
+            for category, total_amount_value, transaction_count, percentage in categories
         ]
-        category_summaries.sort(key=lambda x: x.total_amount, reverse=True)
 
         return {
             "success": True,
@@ -300,8 +450,8 @@ class ExpenseFacade:
         }
 
     def get_monthly_expenses(self, year: int, month: int) -> dict:
-        expenses = self._repository.list_month(self._user.id, year, month)
-        if not expenses:
+        rows = self._repository.month_category_totals(self._user.id, year, month)
+        if not rows:
             return {
                 "success": True,
                 "data": MonthlyExpense(
@@ -314,30 +464,24 @@ class ExpenseFacade:
                 "message": f"No expenses found for {month}/{year}",
             }
 
-        total_amount = sum(expense.amount for expense in expenses)
-        category_totals = {}
-        for expense in expenses:
-            category_totals.setdefault(expense.category, {"amount": 0.0, "count": 0})
-            category_totals[expense.category]["amount"] += expense.amount
-            category_totals[expense.category]["count"] += 1
-
+        total_amount = sum(row[1] for row in rows)
         categories = [
             CategorySummary(
                 category=category,
-                total_amount=values["amount"],
-                count=values["count"],
-                percentage=round((values["amount"] / total_amount) * 100, 2)
+                total_amount=category_amount,
+                count=category_count,
+                percentage=round((category_amount / total_amount) * 100, 2)
                 if total_amount
                 else 0,
             )
-            for category, values in category_totals.items()
+            for category, category_amount, category_count in rows
         ]
 
         monthly_expense = MonthlyExpense(
             year=year,
             month=month,
             total_amount=total_amount,
-            count=len(expenses),
+            count=sum(row[2] for row in rows),
             categories=categories,
         )
 
@@ -361,10 +505,12 @@ class ExpenseFacade:
 
         try:
             receipt_url = await upload_receipt_image(file)
-            updated = self._repository.update(expense, {"receipt_url": receipt_url})
+            updated = self._repository.update(
+                self._user.id, expense_id, {"receipt_url": receipt_url}
+            )
             return {
                 "success": True,
-                "data": ExpenseOut.model_validate(updated),
+                "data": _expense_to_out(updated),
                 "message": "Receipt uploaded successfully",
             }
         except Exception as exc:  # pragma: no cover - defensive rollback
@@ -376,7 +522,7 @@ class ExpenseFacade:
 
     def get_recurring_expenses(self) -> dict:
         expenses = self._repository.list_recurring(self._user.id)
-        expense_list = [ExpenseOut.model_validate(expense) for expense in expenses]
+        expense_list = [_expense_to_out(expense) for expense in expenses]
         return {
             "success": True,
             "data": expense_list,
@@ -389,72 +535,88 @@ class ExpenseFacade:
         format: str = "csv",
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> dict:
-        expenses = self._repository.list_between_dates(
+    ) -> Union[Iterator[str], dict]:
+        """Export expenses in the requested format.
+
+        CSV exports are returned as an iterator of text chunks so the router
+        can stream them; JSON exports keep the standard response envelope.
+        Both read the rows through a server-side cursor.
+        """
+        if format.lower() == "csv":
+            return self._iter_csv_export(start_date, end_date)
+
+        expenses = self._repository.iter_between_dates(
             self._user.id,
             start_date=start_date,
             end_date=end_date,
+            batch_size=EXPORT_BATCH_SIZE,
         )
+        expense_list = [_expense_to_out(expense) for expense in expenses]
+        return {
+            "success": True,
+            "data": expense_list,
+            "message": f"Exported {len(expense_list)} expenses to JSON",
+        }
 
-        if format.lower() == "csv":
-            output = io.StringIO()
-            writer = csv.writer(output)
+    def _iter_csv_export(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Iterator[str]:
+        """Stream the CSV export from a session owned by the generator.
+
+        The response body is drained after the endpoint returns, when the
+        request's ``get_db`` session may already be closed, so the cursor
+        runs on a dedicated session that is closed when the stream ends.
+        """
+        db = SessionLocal()
+        try:
+            expenses = ExpenseRepository(db).iter_between_dates(
+                self._user.id,
+                start_date=start_date,
+                end_date=end_date,
+                batch_size=EXPORT_BATCH_SIZE,
+            )
+            yield from self._iter_csv(expenses)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _iter_csv(expenses: Iterable[Expense]) -> Iterator[str]:
+        """Yield CSV text in batches of ``EXPORT_BATCH_SIZE`` rows."""
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(EXPORT_CSV_HEADER)
+        for index, expense in enumerate(expenses, start=1):
+            tags = _normalize_tags(expense.tags)
             writer.writerow(
                 [
-                    "ID",
-                    "Amount",
-                    "Currency",
-                    "Category",
-                    "Subcategory",
-                    "Merchant",
-                    "Description",
-                    "Date",
-                    "Payment Method",
-                    "Is Recurring",
-                    "Tags",
-                    "Created At",
+                    str(expense.id),
+                    expense.amount,
+                    expense.currency,
+                    expense.category,
+                    expense.subcategory or "",
+                    expense.merchant or "",
+                    expense.description or "",
+                    expense.date.isoformat(),
+                    expense.payment_method or "",
+                    expense.is_recurring,
+                    ", ".join(tags),
+                    expense.created_at.isoformat(),
                 ]
             )
-            for expense in expenses:
-                tags = json.loads(expense.tags) if expense.tags else []
-                writer.writerow(
-                    [
-                        str(expense.id),
-                        expense.amount,
-                        expense.currency,
-                        expense.category,
-                        expense.subcategory or "",
-                        expense.merchant or "",
-                        expense.description or "",
-                        expense.date.isoformat(),
-                        expense.payment_method or "",
-                        expense.is_recurring,
-                        ", ".join(tags),
-                        expense.created_at.isoformat(),
-                    ]
-                )
-            csv_content = output.getvalue()
-            output.close()
-            return {
-                "success": True,
-                "data": csv_content,
-                "message": f"Exported {len(expenses)} expenses to CSV",
-            }
-
-        expense_list = [ExpenseOut.model_validate(expense) for expense in expenses]
-        return {
-            "success": True,
-            "data": expense_list,
-            "message": f"Exported {len(expenses)} expenses to JSON",
-        }
+            if index % EXPORT_BATCH_SIZE == 0:
+                yield output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+        yield output.getvalue()
+        output.close()
 
     # ------------------------------------------------------------------
     # AI powered helpers
     # ------------------------------------------------------------------
     @ai_rate_limit(feature="expenses:parse_text", key_func=_facade_user_key)
     async def parse_text_with_ai(self, text: str) -> dict:
-        from app.services.ai_service import ai_service
-
         try:
             parsed_data = await ai_service.parse_text_expense(text)
             if not parsed_data.get("is_expense_related", True):
@@ -496,8 +658,6 @@ class ExpenseFacade:
 
     @ai_rate_limit(feature="expenses:parse_receipt", key_func=_facade_user_key)
     async def parse_receipt_with_ai(self, image_file: UploadFile) -> dict:
-        from app.services.ai_service import ai_service
-
         try:
             parsed_data = await ai_service.parse_receipt_image(image_file)
             if parsed_data.get("confidence", 0) < 0.5:
@@ -528,8 +688,6 @@ class ExpenseFacade:
 
     @ai_rate_limit(feature="expenses:parse_voice", key_func=_facade_user_key)
     async def parse_voice_with_ai(self, audio_file: UploadFile) -> dict:
-        from app.services.ai_service import ai_service
-
         try:
             parsed_data = await ai_service.parse_voice_expense(audio_file)
             if parsed_data.get("confidence", 0) < 0.5:
@@ -563,8 +721,6 @@ class ExpenseFacade:
 
     @ai_rate_limit(feature="expenses:insights", key_func=_facade_user_key)
     async def get_ai_insights(self, days: int = 30) -> dict:
-        from app.services.ai_service import ai_service
-
         try:
             # Always analyze the current calendar month so the dashboard reflects monthly spend
             end_date = datetime.now().replace(hour=23, minute=59, second=59, microsecond=999_999)
@@ -609,44 +765,16 @@ class ExpenseFacade:
     # Dashboard helpers
     # ------------------------------------------------------------------
     def get_total_spend_dashboard(self) -> dict:
-        now = datetime.now()
-        current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        _, last_day = calendar.monthrange(now.year, now.month)
-        current_month_end = now.replace(
-            day=last_day,
-            hour=23,
-            minute=59,
-            second=59,
-            microsecond=999_999,
-        )
-
-        if now.month == 1:
-            prev_year = now.year - 1
-            prev_month = 12
-        else:
-            prev_year = now.year
-            prev_month = now.month - 1
-        previous_month_start = datetime(prev_year, prev_month, 1)
-        _, prev_last_day = calendar.monthrange(prev_year, prev_month)
-        previous_month_end = datetime(
-            prev_year,
-            prev_month,
-            prev_last_day,
-            23,
-            59,
-            59,
-            999_999,
+        now = _dashboard_now()
+        current_month_start, current_month_end, previous_month_start = _month_bounds(
+            now.year, now.month
         )
 
-        current_total = self._repository.sum_amount(
-            self._user.id,
-            start_date=current_month_start,
-            end_date=current_month_end,
-        )
-        previous_total = self._repository.sum_amount(
+        previous_total, current_total = self._repository.split_period_totals(
             self._user.id,
             start_date=previous_month_start,
-            end_date=previous_month_end,
+            split_date=current_month_start,
+            end_date=current_month_end,
         )
 
         if previous_total > 0:
@@ -661,7 +789,7 @@ class ExpenseFacade:
         else:
             change_direction = "same"
 
-        data = TotalSpendData(
+        data = TotalSpendData.model_construct(
             current_month=round(current_total, 2),
             previous_month=round(previous_total, 2),
             percentage_change=round(percentage_change, 2),
@@ -674,35 +802,21 @@ class ExpenseFacade:
         }
 
     def get_category_breakdown_dashboard(self, period: str = "current_month") -> dict:
-        now = datetime.now()
+        now = _dashboard_now()
         if period == "current_month":
-            start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            _, last_day = calendar.monthrange(now.year, now.month)
-            end_date = now.replace(
-                day=last_day,
-                hour=23,
-                minute=59,
-                second=59,
-                microsecond=999_999,
-            )
+            start_date, end_date, _ = _month_bounds(now.year, now.month)
         elif period == "last_30_days":
-            end_date = now
+            # End of today rather than ``now``: the minute-truncated ``now``
+            # would drop expenses dated within the current minute
+            end_date = _end_of_day(now)
             start_date = now - timedelta(days=30)
         elif period == "current_year":
             start_date = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-            end_date = now
+            end_date = _end_of_day(now)
         else:
-            start_date = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            _, last_day = calendar.monthrange(now.year, now.month)
-            end_date = now.replace(
-                day=last_day,
-                hour=23,
-                minute=59,
-                second=59,
-                microsecond=999_999,
-            )
+            start_date, end_date, _ = _month_bounds(now.year, now.month)
 
-        categories = self._repository.category_breakdown(
+        categories = self._repository.category_shares(
             self._user.id,
             start_date=start_date,
             end_date=end_date,
@@ -714,19 +828,15 @@ class ExpenseFacade:
                 "message": "No expenses found for the selected period",
             }
 
-        total_amount = sum(cat[1] for cat in categories)
         breakdown = [
-            CategoryBreakdownItem(
+            CategoryBreakdownItem.model_construct(
                 category=category,
-                amount=round(total_amount_value, 2),
-                percentage=round((total_amount_value / total_amount) * 100, 2)
-                if total_amount
-                else 0,
+                amount=total_amount_value,
+                percentage=percentage,
                 transaction_count=transaction_count,
             )
-            for category, total_amount_value, transaction_count in categories
+            for category, total_amount_value, transaction_count, percentage in categories
         ]
-        breakdown.sort(key=lambda item: item.amount, reverse=True)
         return {
             "success": True,
             "data": breakdown,
@@ -734,19 +844,9 @@ class ExpenseFacade:
         }
 
     def get_category_trend_dashboard(self, months: int = 6) -> dict:
-        now = datetime.now()
-        current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        if current_month_start.month == 12:
-            end_date = current_month_start.replace(year=current_month_start.year + 1, month=1)
-        else:
-            end_date = current_month_start.replace(month=current_month_start.month + 1)
-
-        start_year = current_month_start.year
-        start_month = current_month_start.month - (months - 1)
-        while start_month <= 0:
-            start_month += 12
-            start_year -= 1
-        start_date = datetime(start_year, start_month, 1)
+        now = _dashboard_now()
+        end_date = datetime(*_shift_month(now.year, now.month, 1), 1)
+        start_date = datetime(*_shift_month(now.year, now.month, -(months - 1)), 1)
 
         rows = self._repository.category_totals_by_month(
             self._user.id,
@@ -760,30 +860,15 @@ class ExpenseFacade:
                 "message": "No expense data found for the specified period",
             }
 
-        months_totals = {}
-        month_categories = {}
-        for year, month, category, amount in rows:
-            month_key = f"{int(year)}-{int(month):02d}"
-            months_totals.setdefault(month_key, 0.0)
-            month_categories.setdefault(month_key, {})
-            months_totals[month_key] += amount
-            month_categories[month_key][category] = amount
-
-        trend_data = []
-        for month_key, categories in month_categories.items():
-            month_total = months_totals[month_key]
-            for category, amount in categories.items():
-                trend_data.append(
-                    CategoryTrendMonth(
-                        month=month_key,
-                        category=category,
-                        amount=round(amount, 2),
-                        percentage=round((amount / month_total) * 100, 2)
-                        if month_total
-                        else 0,
-                    )
-                )
-        trend_data.sort(key=lambda x: (x.month, -x.amount))
+        trend_data = [
+            CategoryTrendMonth.model_construct(
+                month=f"{int(year)}-{int(month):02d}",
+                category=category,
+                amount=amount,
+                percentage=percentage,
+            )
+            for year, month, category, amount, percentage in rows
+        ]
         return {
             "success": True,
             "data": trend_data,
@@ -796,39 +881,34 @@ class ExpenseFacade:
         period: str = "daily",
         days: int = 30,
     ) -> dict:
-        now = datetime.now()
+        now = _dashboard_now()
+        format_period = str
         if period == "daily":
             start_date = now - timedelta(days=days)
-            group_expression = func.date(Expense.date)
+            bucket = "day"
         elif period == "weekly":
             start_date = now - timedelta(weeks=max(days // 7, 4))
-            group_expression = func.concat(
-                cast(func.extract('year', Expense.date), String),
-                '-W',
-                func.lpad(cast(func.extract('week', Expense.date), String), 2, '0'),
-            )
+            bucket = "week"
+            format_period = _format_iso_week
         elif period == "monthly":
             start_date = now - timedelta(days=max(days, 90))
-            group_expression = func.concat(
-                cast(func.extract('year', Expense.date), String),
-                '-',
-                func.lpad(cast(func.extract('month', Expense.date), String), 2, '0'),
-            )
+            bucket = "month"
+            format_period = _format_month
         else:
             start_date = now - timedelta(days=30)
-            group_expression = func.date(Expense.date)
+            bucket = "day"
 
         rows = self._repository.spend_trend(
             self._user.id,
             start_date=start_date,
-            group_expression=group_expression,
+            bucket=bucket,
         )
         trend_list = []
         for period_value, total_amount, transaction_count in rows:
             trend_list.append(
-                SpendTrendData(
-                    date=str(period_value),
-                    amount=round(total_amount, 2),
+                SpendTrendData.model_construct(
+                    date=format_period(period_value),
+                    amount=total_amount,
                     transaction_count=transaction_count,
                 )
             )
@@ -847,24 +927,10 @@ class ExpenseFacade:
         now = datetime.now()
         if period == "weekly":
             start_date = now - timedelta(weeks=1)
-        elif period == "monthly":
-            if now.month == 1:
-                prev_year = now.year - 1
-                prev_month = 12
-            else:
-                prev_year = now.year
-                prev_month = now.month - 1
-            start_date = datetime(prev_year, prev_month, now.day)
         elif period == "yearly":
-            start_date = datetime(now.year - 1, now.month, now.day)
+            start_date = _same_day_months_ago(now, 12)
         else:
-            if now.month == 1:
-                prev_year = now.year - 1
-                prev_month = 12
-            else:
-                prev_year = now.year
-                prev_month = now.month - 1
-            start_date = datetime(prev_year, prev_month, now.day)
+            start_date = _same_day_months_ago(now, 1)
 
         transactions = self._repository.top_transactions(
             self._user.id,
@@ -872,15 +938,8 @@ class ExpenseFacade:
             limit=limit,
         )
         transaction_list = [
-            TopTransactionData(
-                id=item.id,
-                amount=round(item.amount, 2),
-                category=item.category,
-                merchant=item.merchant,
-                description=item.description,
-                date=item.date,
-            )
-            for item in transactions
+            TopTransactionData.model_construct(**row._mapping)
+            for row in transactions
         ]
         return {
             "success": True,
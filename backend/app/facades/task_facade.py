@@ -1,16 +1,22 @@
 """Facade for orchestrating task workflows."""
 from __future__ import annotations
 
+import asyncio
+import base64
 import json
+import operator
+import re
 from collections import defaultdict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException, UploadFile, status
+from sqlalchemy.orm import Session
 
 from app.models.models import User
-from app.repositories.task_repository import TaskRepository
+from app.repositories.task_repository import TaskCursor, TaskRepository
 from app.schemas.tasks import (
     TaskCreate,
     TaskOut,
@@ -29,6 +35,130 @@ def _facade_user_key(instance, *_args, **_kwargs) -> str:
     return f"user:{user_id}"
 
 
+# Relative due dates understood by the keyword parser, checked in order.
+_DUE_OFFSETS = (
+    ("tomorrow", timedelta(days=1)),
+    ("today", timedelta()),
+    ("next week", timedelta(weeks=1)),
+)
+_DUE_RE = re.compile("|".join(re.escape(keyword) for keyword, _ in _DUE_OFFSETS))
+_HIGH_PRIORITY_RE = re.compile(r"urgent|important|asap|high priority")
+_LOW_PRIORITY_RE = re.compile(r"low priority|when possible|sometime")
+# First whitespace-delimited word that ends the title.
+_TITLE_END_RE = re.compile(r"(?<!\S)(?:by|on|before|at|due|tomorrow|today|next)(?!\S)", re.IGNORECASE)
+_TAG_RE = re.compile(r"#(\w+)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_task_text(text: str) -> tuple[str, str, Optional[timedelta], tuple[str, ...]]:
+    """Return (title, priority, due offset, tags) for ``text``.
+
+    This is the time-independent part of ``parse_natural_language``; the due
+    offset is applied to the current time by the caller, so cached results
+    never carry a stale date.
+    """
+    text_lower = text.lower()
+    title_end = _TITLE_END_RE.search(text)
+    title = " ".join((text[:title_end.start()] if title_end else text).split())
+
+    priority = "medium"
+    if _HIGH_PRIORITY_RE.search(text_lower):
+        priority = "high"
+    elif _LOW_PRIORITY_RE.search(text_lower):
+        priority = "low"
+
+    due_keywords = set(_DUE_RE.findall(text_lower))
+    due_offset = next((offset for keyword, offset in _DUE_OFFSETS if keyword in due_keywords), None)
+    tags = tuple(_TAG_RE.findall(text))
+    return title, priority, due_offset, tags
+
+
+# Column conversions for ``TaskUpdate`` fields, applied in one pass.
+_UPDATE_NORMALIZERS = {
+    "tags": lambda tags: tags or None,
+    "priority": lambda priority: priority.value if priority else priority,
+    "status": lambda task_status: task_status.value if task_status else task_status,
+}
+
+
+def _encode_cursor(key: TaskCursor) -> str:
+    """Serialize a task list sort key into an opaque, URL-safe cursor."""
+    due_date, priority_rank, created_at, task_id = key
+    raw = json.dumps([
+        due_date.isoformat() if due_date else None,
+        priority_rank,
+        created_at.isoformat(),
+        str(task_id),
+    ])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> TaskCursor:
+    """Parse a cursor produced by :func:`_encode_cursor`."""
+    try:
+        due_date, priority_rank, created_at, task_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return (
+            datetime.fromisoformat(due_date) if due_date else None,
+            int(priority_rank),
+            datetime.fromisoformat(created_at),
+            UUID(task_id),
+        )
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
+_TASK_OUT_ATTRS = operator.attrgetter(
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "due_date",
+    "priority",
+    "status",
+    "is_completed",
+    "completion_date",
+    "estimated_duration",
+    "actual_duration",
+    "tags",
+    "parent_task_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _task_to_out(task) -> TaskOut:
+    """Build a ``TaskOut`` from a task row or instance without validation.
+
+    Values come straight from our own table, so only the enum columns need
+    converting.
+    """
+    (
+        task_id, user_id, title, description, due_date, priority, task_status,
+        is_completed, completion_date, estimated_duration, actual_duration,
+        tags, parent_task_id, created_at, updated_at,
+    ) = _TASK_OUT_ATTRS(task)
+    return TaskOut.model_construct(
+        id=task_id,
+        user_id=user_id,
+        title=title,
+        description=description,
+        due_date=due_date,
+        priority=TaskPriority(priority),
+        status=TaskStatus(task_status),
+        is_completed=is_completed,
+        completion_date=completion_date,
+        estimated_duration=estimated_duration,
+        actual_duration=actual_duration,
+        tags=tags or [],
+        parent_task_id=parent_task_id,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
 class TaskFacade:
     """Coordinates repository calls and ancillary validation for tasks."""
 
@@ -36,6 +166,20 @@ class TaskFacade:
         self._repository = repository
         self._user = user
 
+    @classmethod
+    def for_session(cls, db: Session, user: User) -> "TaskFacade":
+        """Return the facade cached on ``db.info`` for this user.
+
+        ``Session.info`` lives exactly as long as the request-scoped session,
+        so repeated lookups within one request reuse a single repository and
+        facade pair.
+        """
+        cache = db.info.setdefault("_task_facades", {})
+        facade = cache.get(user.id)
+        if facade is None:
+            facade = cache[user.id] = cls(TaskRepository(db), user)
+        return facade
+
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
@@ -51,8 +195,10 @@ class TaskFacade:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> dict:
-        tasks, total = self._repository.list_tasks(
+        tasks, total, next_key = self._repository.list_tasks(
             self._user.id,
             status_filter=getattr(status_filter, "value", status_filter),
             priority=getattr(priority, "value", priority),
@@ -63,19 +209,26 @@ class TaskFacade:
             search=search,
             page=page,
             limit=limit,
+            after=_decode_cursor(cursor) if cursor else None,
+            include_total=include_total,
         )
 
-        task_list = [TaskOut.model_validate(task) for task in tasks]
+        task_list = [_task_to_out(task) for task in tasks]
+
+        meta = {
+            "page": page,
+            "limit": limit,
+            "next_cursor": _encode_cursor(next_key) if next_key else None,
+        }
+        if total is not None:
+            meta["total"] = total
+            meta["pages"] = (total + limit - 1) // limit
+
         return {
             "success": True,
             "data": task_list,
             "message": f"Retrieved {len(task_list)} tasks",
-            "meta": {
-                "page": page,
-                "limit": limit,
-                "total": total,
-                "pages": (total + limit - 1) // limit,
-            },
+            "meta": meta,
         }
 
     def create_task(self, task_data: TaskCreate) -> dict:
@@ -94,7 +247,7 @@ class TaskFacade:
             "priority": task_data.priority.value,
             "status": task_data.status.value,
             "estimated_duration": task_data.estimated_duration,
-            "tags": json.dumps(task_data.tags) if task_data.tags else None,
+            "tags": task_data.tags or None,
             "parent_task_id": task_data.parent_task_id,
         }
 
@@ -102,7 +255,7 @@ class TaskFacade:
             task = self._repository.create(self._user.id, payload)
             return {
                 "success": True,
-                "data": TaskOut.model_validate(task),
+                "data": _task_to_out(task),
                 "message": "Task created successfully",
             }
         except Exception as exc:  # pragma: no cover - defensive rollback
@@ -121,7 +274,7 @@ class TaskFacade:
             )
         return {
             "success": True,
-            "data": TaskOut.model_validate(task),
+            "data": _task_to_out(task),
             "message": "Task retrieved successfully",
         }
 
@@ -141,13 +294,10 @@ class TaskFacade:
                     detail="Parent task not found",
                 )
 
-        update_data = task_data.model_dump(exclude_unset=True)
-        if "tags" in update_data:
-            update_data["tags"] = json.dumps(update_data["tags"]) if update_data["tags"] else None
-        if "priority" in update_data and update_data["priority"]:
-            update_data["priority"] = update_data["priority"].value
-        if "status" in update_data and update_data["status"]:
-            update_data["status"] = update_data["status"].value
+        update_data = {
+            field: _UPDATE_NORMALIZERS[field](value) if field in _UPDATE_NORMALIZERS else value
+            for field, value in task_data.model_dump(exclude_unset=True).items()
+        }
 
         if task_data.status:
             if task_data.status == TaskStatus.completed:
@@ -162,7 +312,7 @@ class TaskFacade:
             updated = self._repository.update(task, update_data)
             return {
                 "success": True,
-                "data": TaskOut.model_validate(updated),
+                "data": _task_to_out(updated),
                 "message": "Task updated successfully",
             }
         except Exception as exc:  # pragma: no cover - defensive rollback
@@ -173,25 +323,24 @@ class TaskFacade:
             ) from exc
 
     def delete_task(self, task_id: UUID) -> dict:
-        task = self._repository.get_by_id(self._user.id, task_id)
-        if not task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found",
-            )
         try:
-            self._repository.delete(task, delete_subtasks=True)
-            return {
-                "success": True,
-                "message": "Task deleted successfully",
-                "data": None,
-            }
+            deleted = self._repository.delete(self._user.id, task_id, delete_subtasks=True)
         except Exception as exc:  # pragma: no cover - defensive rollback
             self._repository.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to delete task: {exc}",
             ) from exc
+        if not deleted:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found",
+            )
+        return {
+            "success": True,
+            "message": "Task deleted successfully",
+            "data": None,
+        }
 
     def complete_task(self, task_id: UUID, actual_duration: Optional[int] = None) -> dict:
         task = self._repository.get_by_id(self._user.id, task_id)
@@ -212,7 +361,7 @@ class TaskFacade:
         updated = self._repository.update(task, update_data)
         return {
             "success": True,
-            "data": TaskOut.model_validate(updated),
+            "data": _task_to_out(updated),
             "message": "Task marked as completed",
         }
 
@@ -221,7 +370,7 @@ class TaskFacade:
     # ------------------------------------------------------------------
     def get_today_tasks(self) -> dict:
         tasks = self._repository.list_today(self._user.id)
-        task_list = [TaskOut.model_validate(task) for task in tasks]
+        task_list = [_task_to_out(task) for task in tasks]
         return {
             "success": True,
             "data": task_list,
@@ -240,7 +389,7 @@ class TaskFacade:
 
     def get_overdue_tasks(self) -> dict:
         tasks = self._repository.list_overdue(self._user.id)
-        task_list = [TaskOut.model_validate(task) for task in tasks]
+        task_list = [_task_to_out(task) for task in tasks]
         return {
             "success": True,
             "data": task_list,
@@ -254,43 +403,15 @@ class TaskFacade:
     @staticmethod
     def parse_natural_language(text: str) -> dict:
         """Simple keyword-based parser (non-AI)."""
-        result = {
-            "title": "",
+        title, priority, due_offset, tags = _parse_task_text(text)
+        return {
+            "title": title,
             "description": None,
-            "due_date": None,
-            "priority": "medium",
-            "tags": [],
+            "due_date": (datetime.now() + due_offset).isoformat() if due_offset is not None else None,
+            "priority": priority,
+            "tags": list(tags),
         }
 
-        text_lower = text.lower()
-        title_indicators = ["by", "on", "before", "at", "due", "tomorrow", "today", "next"]
-        title_parts = text.split()
-        title_end = len(title_parts)
-        for i, word in enumerate(title_parts):
-            if word.lower() in title_indicators:
-                title_end = i
-                break
-        result["title"] = " ".join(title_parts[:title_end]).strip()
-
-        if any(word in text_lower for word in ["urgent", "important", "asap", "high priority"]):
-            result["priority"] = "high"
-        elif any(word in text_lower for word in ["low priority", "when possible", "sometime"]):
-            result["priority"] = "low"
-
-        if "tomorrow" in text_lower:
-            result["due_date"] = (datetime.now() + timedelta(days=1)).isoformat()
-        elif "today" in text_lower:
-            result["due_date"] = datetime.now().isoformat()
-        elif "next week" in text_lower:
-            result["due_date"] = (datetime.now() + timedelta(weeks=1)).isoformat()
-
-        if "#" in text:
-            import re  # Local import to avoid unused dependency when not needed
-            tags = re.findall(r"#(\w+)", text)
-            result["tags"] = tags
-
-        return result
-
     # ------------------------------------------------------------------
     # AI-powered helpers
     # ------------------------------------------------------------------
@@ -363,7 +484,8 @@ class TaskFacade:
             }
 
     async def get_ai_insights(self) -> dict:
-        tasks = self._repository.list_for_insights(self._user.id)
+        # Keep the blocking query off the event loop
+        tasks = await asyncio.to_thread(self._repository.list_for_insights, self._user.id)
         if not tasks:
             return {
                 "success": True,
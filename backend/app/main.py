@@ -4,9 +4,10 @@ import math
 from fastapi import FastAPI, Request, status
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from app.core.config import settings
 from app.services.decorators.rate_limit import RateLimitExceededError
+from app.utils.upload import ensure_upload_dirs
 
 
 app = FastAPI(
@@ -14,6 +15,7 @@ app = FastAPI(
     description="A unified web application that empowers users to effortlessly track and reflect on key aspects of their daily lives",
     version="1.0.0",
     redirect_slashes=False,
+    default_response_class=ORJSONResponse,
     swagger_ui_parameters={
         "syntaxHighlight.theme": "monokai",
         "layout": "BaseLayout",
@@ -33,8 +35,13 @@ app.add_middleware(
 )
 
 
-# Mount the uploads directory to serve static files
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# Mount the uploads directory to serve static files; it is created on startup
+app.mount("/uploads", StaticFiles(directory="uploads", check_dir=False), name="uploads")
+
+
+@app.on_event("startup")
+def prepare_upload_dirs() -> None:
+    ensure_upload_dirs()
 
 
 # Include routers
@@ -1,8 +1,8 @@
-from sqlalchemy import Boolean, Column, Integer, String, ForeignKey, Float, ARRAY, Enum, Text
+from sqlalchemy import Boolean, Column, Computed, Date, Integer, String, ForeignKey, Float, ARRAY, Enum, Text
 from sqlalchemy.sql.expression import text
 from sqlalchemy.sql.sqltypes import TIMESTAMP
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import backref, deferred, relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from app.db.database import Base
 import uuid
 
@@ -26,6 +26,9 @@ class User(Base):
     role = Column(Enum("admin", "user", name="user_roles"), nullable=False, server_default="user")
     # Keep is_active for backward compatibility  
     is_active = Column(Boolean, server_default="True", nullable=False)
+    # Latest journal_entries.created_at, maintained by a database trigger
+    # (sql/journal_last_entry_migration.sql); deferred so it is never loaded
+    last_journal_at = deferred(Column(TIMESTAMP(timezone=True), nullable=True))
 
 
 class UserPreferences(Base):
@@ -35,7 +38,7 @@ class UserPreferences(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), unique=True, nullable=False)
     default_task_priority = Column(Enum("low", "medium", "high", name="task_priorities"), server_default="medium", nullable=False)
     default_expense_currency = Column(String, server_default="Taka", nullable=False)
-    notification_settings = Column(String, nullable=True)  # JSON stored as string
+    notification_settings = Column(JSONB, nullable=True)
     theme = Column(Enum("light", "dark", "auto", name="themes"), server_default="auto", nullable=False)
     language = Column(String, server_default="en", nullable=False)
     date_format = Column(String, server_default="YYYY-MM-DD", nullable=False)
@@ -45,8 +48,9 @@ class UserPreferences(Base):
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), onupdate=text("NOW()"), nullable=False)
     
-    # Relationship
-    user = relationship("User", backref="preferences")
+    # Relationship: one row per user, joined into every User load so the
+    # auth dependency's user arrives with its preferences
+    user = relationship("User", backref=backref("preferences", uselist=False, lazy="joined"))
 
 
 class Expense(Base):
@@ -73,14 +77,36 @@ class Expense(Base):
     receipt_url = Column(String, nullable=True)
     is_recurring = Column(Boolean, server_default="False", nullable=False)
     recurrence_rule = Column(String, nullable=True)
-    tags = Column(String, nullable=True)  # JSON stored as string
+    tags = Column(JSONB, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), onupdate=text("NOW()"), nullable=False)
+    # Generated full-text document for the list search; deferred so it is never loaded
+    search_doc = deferred(Column(TSVECTOR, Computed(
+        "to_tsvector('simple', coalesce(description, '') || ' ' || "
+        "coalesce(merchant, '') || ' ' || coalesce(subcategory, ''))",
+        persisted=True,
+    )))
     
     # Relationship
     user = relationship("User", backref="expenses")
 
 
+class ExpenseRollup(Base):
+    """Per-user monthly category totals, maintained by a trigger on ``expenses``."""
+
+    __tablename__ = "expense_rollup"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    month = Column(Date, primary_key=True)
+    category = Column(Enum(
+        "food", "transport", "entertainment", "bills", "shopping",
+        "health", "education", "travel", "other",
+        name="expense_categories", create_type=False
+    ), primary_key=True)
+    total_amount = Column(Float, nullable=False)
+    transaction_count = Column(Integer, nullable=False)
+
+
 class Event(Base):
     __tablename__ = "events"
 
@@ -117,7 +143,7 @@ class Task(Base):
     completion_date = Column(TIMESTAMP(timezone=True), nullable=True)
     estimated_duration = Column(Integer, nullable=True)  # in minutes
     actual_duration = Column(Integer, nullable=True)  # in minutes
-    tags = Column(String, nullable=True)  # JSON stored as string
+    tags = Column(JSONB, nullable=True)
     parent_task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), onupdate=text("NOW()"), nullable=False)
@@ -146,6 +172,12 @@ class JournalEntry(Base):
     location = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=text("NOW()"), onupdate=text("NOW()"), nullable=False)
+    # Generated full-text document for the entry search; deferred so it is never loaded
+    search_doc = deferred(Column(TSVECTOR, Computed(
+        "to_tsvector('english', coalesce(title, '') || ' ' || "
+        "coalesce(content, '') || ' ' || coalesce(summary, ''))",
+        persisted=True,
+    )))
     
     # Relationship
     user = relationship("User", backref="journal_entries")
@@ -2,15 +2,56 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, case, cast, func, literal, or_, update
+from sqlalchemy.dialects.postgresql import JSONB, array
 from sqlalchemy.orm import Session
 
 from app.models.models import Event
 
 
+EVENT_JSON_FIELDS = (
+    "id",
+    "user_id",
+    "title",
+    "description",
+    "start_time",
+    "end_time",
+    "location",
+    "tags",
+    "is_all_day",
+    "reminder_minutes",
+    "recurrence_rule",
+    "color",
+    "created_at",
+    "updated_at",
+)
+
+
+def _event_json():
+    """Build ``jsonb_build_object(...)`` shaping an event row for list responses.
+
+    PostgreSQL assembles the response object and psycopg2 hands it back as a
+    ready-made ``dict``. ``tags`` is emitted only when it is a JSON array and
+    as an empty array otherwise (NULL, or legacy ``{"tags": [...]}`` rows),
+    matching what ``EventOut`` validation used to return.
+    """
+    columns = Event.__table__.c
+    arguments = []
+    for name in EVENT_JSON_FIELDS:
+        value = columns[name]
+        if name == "tags":
+            tags = cast(value, JSONB)
+            value = case(
+                (func.jsonb_typeof(tags) == "array", tags),
+                else_=cast(literal("[]"), JSONB),
+            )
+        arguments.extend((literal(name), value))
+    return func.jsonb_build_object(*arguments, type_=JSONB)
+
+
 class EventRepository:
     """Encapsulates persistence operations for :class:`Event`."""
 
@@ -27,20 +68,19 @@ class EventRepository:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
-    ) -> Tuple[List[Event], int]:
-        """Return paginated events for a user with applied filters."""
-        query = self._base_query(user_id)
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Return paginated event rows (as dicts) for a user with applied filters."""
+        conditions = [Event.user_id == user_id]
 
         if start_date:
-            query = query.filter(Event.start_time >= start_date)
+            conditions.append(Event.start_time >= start_date)
         if end_date:
-            query = query.filter(Event.end_time <= end_date)
+            conditions.append(Event.end_time <= end_date)
         if tags:
-            like_filters = [Event.tags.like(f'%"{tag}"%') for tag in tags]
-            query = query.filter(or_(*like_filters))
+            conditions.append(self._tags_filter(tags))
         if search:
             like_pattern = f"%{search}%"
-            query = query.filter(
+            conditions.append(
                 or_(
                     Event.title.ilike(like_pattern),
                     Event.description.ilike(like_pattern),
@@ -48,14 +88,16 @@ class EventRepository:
                 )
             )
 
-        total = query.count()
+        total = self._db.query(func.count(Event.id)).filter(*conditions).scalar()
         events = (
-            query.order_by(Event.start_time)
+            self._db.query(_event_json())
+            .filter(*conditions)
+            .order_by(Event.start_time)
             .offset((page - 1) * limit)
             .limit(limit)
             .all()
         )
-        return events, total
+        return [row[0] for row in events], total
 
     def get_by_id(self, user_id: UUID, event_id: UUID) -> Optional[Event]:
         """Return a single event for the user."""
@@ -73,12 +115,31 @@ class EventRepository:
         self._db.refresh(event)
         return event
 
-    def update(self, event: Event, update_data: Dict[str, object]) -> Event:
-        """Update an existing event."""
-        for key, value in update_data.items():
-            setattr(event, key, value)
+    def update(
+        self,
+        user_id: UUID,
+        event_id: UUID,
+        update_data: Dict[str, object],
+    ) -> Optional[Event]:
+        """Update an event with a single ``UPDATE ... RETURNING`` round-trip.
+
+        Returns ``None`` when no event with ``event_id`` belongs to the user.
+        """
+        if not update_data:
+            return self.get_by_id(user_id, event_id)
+
+        stmt = (
+            update(Event)
+            .where(Event.id == event_id, Event.user_id == user_id)
+            .values(**update_data)
+            .returning(Event)
+            .execution_options(synchronize_session=False)
+        )
+        event = self._db.execute(stmt).scalar_one_or_none()
+        if event is not None:
+            # Detach so the RETURNING values survive expire-on-commit.
+            self._db.expunge(event)
         self._db.commit()
-        self._db.refresh(event)
         return event
 
     def delete(self, event: Event) -> None:
@@ -108,25 +169,38 @@ class EventRepository:
             .all()
         )
 
-    def upcoming(self, user_id: UUID, days: int) -> List[Event]:
-        """Return upcoming events inside the next ``days`` window."""
-        start_date = datetime.now()
-        end_date = start_date + timedelta(days=days)
-
-        return (
-            self._base_query(user_id)
+    def upcoming(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[Dict[str, Any]]:
+        """Return event rows (as dicts) starting inside the ``start_date``..``end_date`` window."""
+        rows = (
+            self._db.query(_event_json())
             .filter(
-                and_(
-                    Event.start_time >= start_date,
-                    Event.start_time <= end_date,
-                )
+                Event.user_id == user_id,
+                Event.start_time >= start_date,
+                Event.start_time <= end_date,
             )
             .order_by(Event.start_time)
             .all()
         )
+        return [row[0] for row in rows]
 
     def rollback(self) -> None:
         self._db.rollback()
 
+    def _tags_filter(self, tags: List[str]):
+        """Match events carrying any of ``tags``.
+
+        On PostgreSQL this is a single ``tags ?| ARRAY[...]`` predicate that the
+        GIN index on ``events.tags`` can serve; other dialects fall back to
+        matching the serialized JSON text.
+        """
+        if self._db.get_bind().dialect.name == "postgresql":
+            return cast(Event.tags, JSONB).has_any(array(tags))
+        return or_(*[Event.tags.like(f'%"{tag}"%') for tag in tags])
+
     def _base_query(self, user_id: UUID):
         return self._db.query(Event).filter(Event.user_id == user_id)
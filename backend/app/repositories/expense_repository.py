@@ -1,14 +1,99 @@
 """Data access helpers for expense domain."""
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
 from uuid import UUID
 
-from sqlalchemy import and_, case, desc, extract, func, or_
+from sqlalchemy import (
+    Numeric,
+    and_,
+    case,
+    cast,
+    delete,
+    desc,
+    event,
+    extract,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
-from app.models.models import Expense
+from app.core.config import settings
+from app.models.models import Expense, ExpenseRollup
+
+T = TypeVar("T")
+
+# Sort key of the expense list: (is_today, date, created_at, id), all descending.
+ExpenseCursor = Tuple[int, datetime, datetime, UUID]
+
+_SEARCH_TERM_RE = re.compile(r"\w+")
+
+# Postgres only rounds ``numeric``; cast back to float on the way out.
+_MONEY = Numeric(asdecimal=False)
+
+
+def _round2(expression):
+    """Round a float SQL expression to two decimals in the database."""
+    return func.round(cast(expression, _MONEY), 2, type_=_MONEY)
+
+# Columns serialized by ``ExpenseOut``; list endpoints select just these.
+EXPENSE_OUT_COLUMNS = (
+    Expense.id,
+    Expense.user_id,
+    Expense.amount,
+    Expense.currency,
+    Expense.category,
+    Expense.subcategory,
+    Expense.merchant,
+    Expense.description,
+    Expense.date,
+    Expense.payment_method,
+    Expense.receipt_url,
+    Expense.is_recurring,
+    Expense.recurrence_rule,
+    Expense.tags,
+    Expense.created_at,
+    Expense.updated_at,
+)
+
+# Short-lived per-process LRU cache of derived per-user results (list counts,
+# summary aggregates, dashboard series), keyed by (user_id, kind, *args) plus
+# the user's write generation. Every expense write bumps the generation, so
+# older entries are never read again and age out of the LRU. Invalidation
+# only reaches the worker that handled the write, so the TTL bounds how stale
+# other workers can be (see ``settings.expense_cache_enabled``).
+COUNT_CACHE_TTL_SECONDS = 30.0
+DASHBOARD_CACHE_TTL_SECONDS = 30.0
+SUMMARY_CACHE_TTL_SECONDS = 30.0
+USER_CACHE_MAX_ENTRIES = 4096
+_user_cache: "OrderedDict[tuple, Tuple[float, object]]" = OrderedDict()
+_user_generations: Dict[UUID, int] = {}
+_user_cache_lock = threading.Lock()
+
+
+def _invalidate_user_cache(user_id: UUID) -> None:
+    with _user_cache_lock:
+        _user_generations[user_id] = _user_generations.get(user_id, 0) + 1
+
+
+@event.listens_for(Expense, "after_insert")
+@event.listens_for(Expense, "after_update")
+@event.listens_for(Expense, "after_delete")
+def _invalidate_on_flush(_mapper, _connection, target: Expense) -> None:
+    """Cover ORM writes made outside this repository (e.g. daily updates)."""
+    _invalidate_user_cache(target.user_id)
 
 
 class ExpenseRepository:
@@ -31,83 +116,191 @@ class ExpenseRepository:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
-    ) -> Tuple[List[Expense], int]:
-        """Return paginated expenses plus total count for the current filters."""
-        query = self._base_query(user_id)
+        after: Optional[ExpenseCursor] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[Row], Optional[int], Optional[ExpenseCursor]]:
+        """Return a page of expense rows, the total count and the next-page cursor.
 
-        if start_date:
-            query = query.filter(Expense.date >= start_date)
-        if end_date:
-            query = query.filter(Expense.date <= end_date)
-        if category:
-            query = query.filter(Expense.category == category)
-        if min_amount is not None:
-            query = query.filter(Expense.amount >= min_amount)
-        if max_amount is not None:
-            query = query.filter(Expense.amount <= max_amount)
-        if search:
-            like_pattern = f"%{search}%"
-            query = query.filter(
-                or_(
-                    Expense.description.ilike(like_pattern),
-                    Expense.merchant.ilike(like_pattern),
-                    Expense.subcategory.ilike(like_pattern),
-                )
+        Rows carry only the ``ExpenseOut`` columns (plus ``is_today``) and are
+        not ORM instances, so no identity-map bookkeeping is done for them.
+
+        When ``after`` is given the page is located with a keyset seek on the
+        sort key instead of ``OFFSET``, and ``page`` is ignored. The total is
+        only computed (and cached briefly) when ``include_total`` is set;
+        otherwise it is ``None``.
+
+        Statements are built with ``lambda_stmt`` so SQLAlchemy caches the
+        compiled SQL per combination of filters; the filter values are bound
+        as parameters on each call.
+        """
+        filters = (start_date, end_date, category, min_amount, max_amount, search)
+        total_count = None
+        if include_total:
+            count_stmt = lambda_stmt(
+                lambda: select(func.count(Expense.id)).where(Expense.user_id == user_id)
+            )
+            count_stmt = self._apply_list_filters(count_stmt, *filters)
+            total_count = self._cached(
+                (user_id, "count", *filters),
+                COUNT_CACHE_TTL_SECONDS,
+                lambda: self._db.execute(count_stmt).scalar_one(),
             )
 
-        total_count = query.count()
         today = datetime.now().date()
-        is_today = case((func.date(Expense.date) == today, 1), else_=0)
-        expenses = (
-            query.order_by(desc(is_today), desc(Expense.date), desc(Expense.created_at))
-            .offset((page - 1) * limit)
-            .limit(limit)
-            .all()
+        stmt = lambda_stmt(
+            lambda: select(
+                Expense.id,
+                Expense.user_id,
+                Expense.amount,
+                Expense.currency,
+                Expense.category,
+                Expense.subcategory,
+                Expense.merchant,
+                Expense.description,
+                Expense.date,
+                Expense.payment_method,
+                Expense.receipt_url,
+                Expense.is_recurring,
+                Expense.recurrence_rule,
+                Expense.tags,
+                Expense.created_at,
+                Expense.updated_at,
+                case((func.date(Expense.date) == today, 1), else_=0).label("is_today"),
+            )
+            .where(Expense.user_id == user_id)
+            .order_by(
+                desc(case((func.date(Expense.date) == today, 1), else_=0)),
+                desc(Expense.date),
+                desc(Expense.created_at),
+                desc(Expense.id),
+            )
         )
-        return expenses, total_count
+        stmt = self._apply_list_filters(stmt, *filters)
+        if after is not None:
+            after_today, after_date, after_created_at, after_id = after
+            stmt += lambda s: s.where(
+                tuple_(
+                    case((func.date(Expense.date) == today, 1), else_=0),
+                    Expense.date,
+                    Expense.created_at,
+                    Expense.id,
+                )
+                < tuple_(after_today, after_date, after_created_at, after_id)
+            )
+            offset = 0
+        else:
+            offset = (page - 1) * limit
+        fetch = limit + 1
+        stmt += lambda s: s.offset(offset).limit(fetch)
+
+        rows = self._db.execute(stmt).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = (last.is_today, last.date, last.created_at, last.id)
+        return rows, total_count, next_cursor
 
     def get_by_id(self, user_id: UUID, expense_id: UUID) -> Optional[Expense]:
-        """Return a single expense for the user or ``None`` if missing."""
-        return (
-            self._base_query(user_id)
-            .filter(Expense.id == expense_id)
-            .first()
-        )
+        """Return a single expense for the user or ``None`` if missing.
+
+        ``Session.get`` answers from the identity map when the row is already
+        loaded in this session and otherwise does a primary-key lookup; the
+        ownership check happens in Python.
+        """
+        expense = self._db.get(Expense, expense_id)
+        if expense is None or expense.user_id != user_id:
+            return None
+        return expense
 
     def create(self, user_id: UUID, payload: Dict[str, object]) -> Expense:
         """Persist a new expense and return the stored instance."""
         expense = Expense(user_id=user_id, **payload)
         self._db.add(expense)
         self._db.commit()
+        _invalidate_user_cache(user_id)
         self._db.refresh(expense)
         return expense
 
-    def update(self, expense: Expense, update_data: Dict[str, object]) -> Expense:
-        """Apply the provided field changes to the expense."""
-        for key, value in update_data.items():
-            setattr(expense, key, value)
+    def bulk_create(
+        self, user_id: UUID, payloads: List[Dict[str, object]]
+    ) -> List[Expense]:
+        """Insert many expenses with one executemany INSERT and commit once.
+
+        Only the new ids come back from ``RETURNING``; the rows are then
+        loaded in a single SELECT after the commit.
+        """
+        if not payloads:
+            return []
+        rows = [{"user_id": user_id, **payload} for payload in payloads]
+        ids = self._db.scalars(insert(Expense).returning(Expense.id), rows).all()
         self._db.commit()
-        self._db.refresh(expense)
-        return expense
+        _invalidate_user_cache(user_id)
+        return (
+            self._base_query(user_id)
+            .filter(Expense.id.in_(ids))
+            .order_by(desc(Expense.date))
+            .all()
+        )
 
-    def delete(self, expense: Expense) -> Expense:
-        """Delete the provided expense instance."""
-        self._db.delete(expense)
+    def update(
+        self,
+        user_id: UUID,
+        expense_id: UUID,
+        update_data: Dict[str, object],
+    ) -> Optional[Union[Row, Expense]]:
+        """Update an expense with a single ``UPDATE ... RETURNING`` round-trip.
+
+        Returns the ``ExpenseOut`` columns of the updated row, or ``None`` when
+        no expense with ``expense_id`` belongs to the user.
+        """
+        if not update_data:
+            return self.get_by_id(user_id, expense_id)
+
+        stmt = (
+            update(Expense)
+            .where(Expense.id == expense_id, Expense.user_id == user_id)
+            .values(**update_data)
+            .returning(*EXPENSE_OUT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        row = self._db.execute(stmt).first()
         self._db.commit()
-        return expense
+        if row is not None:
+            _invalidate_user_cache(user_id)
+        return row
+
+    def delete(self, user_id: UUID, expense_id: UUID) -> Optional[Row]:
+        """Delete an expense with ``DELETE ... RETURNING``; ``None`` if missing."""
+        stmt = (
+            delete(Expense)
+            .where(Expense.id == expense_id, Expense.user_id == user_id)
+            .returning(*EXPENSE_OUT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        row = self._db.execute(stmt).first()
+        self._db.commit()
+        if row is not None:
+            _invalidate_user_cache(user_id)
+        return row
 
     # ------------------------------------------------------------------
     # Domain specific query helpers
     # ------------------------------------------------------------------
-    def list_between_dates(
+    def iter_between_dates(
         self,
         user_id: UUID,
         *,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         order_desc: bool = True,
-    ) -> List[Expense]:
-        """Return all expenses for a user between ``start_date`` and ``end_date``."""
+        batch_size: int = 500,
+    ) -> Iterator[Expense]:
+        """Iterate a user's expenses between ``start_date`` and ``end_date``.
+
+        Rows are fetched through a server-side cursor ``batch_size`` at a
+        time, so memory stays bounded regardless of the range exported.
+        """
         query = self._base_query(user_id)
         if start_date:
             query = query.filter(Expense.date >= start_date)
@@ -115,30 +308,63 @@ class ExpenseRepository:
             query = query.filter(Expense.date <= end_date)
         if order_desc:
             query = query.order_by(desc(Expense.date))
-        return query.all()
+        return iter(
+            query.execution_options(stream_results=True).yield_per(batch_size)
+        )
 
-    def list_month(self, user_id: UUID, year: int, month: int) -> List[Expense]:
-        """Return all expenses for the given month."""
-        return (
-            self._base_query(user_id)
+    def month_category_totals(
+        self,
+        user_id: UUID,
+        year: int,
+        month: int,
+    ) -> List[Tuple[str, float, int]]:
+        """Return (category, total, count) rows for the given month (cached).
+
+        The month is matched with a half-open range on ``date`` rather than
+        ``extract()`` comparisons so the ``(user_id, date)`` index applies.
+        """
+        if settings.expense_rollup_enabled:
+            return self._cached(
+                (user_id, "month_category_totals", year, month),
+                SUMMARY_CACHE_TTL_SECONDS,
+                lambda: [
+                    row[:3]
+                    for row in self._rollup_shares(
+                        ExpenseRollup.user_id == user_id,
+                        ExpenseRollup.month == date(year, month, 1),
+                    )
+                ],
+            )
+        month_start = datetime(year, month, 1)
+        next_month_start = datetime(year + month // 12, month % 12 + 1, 1)
+        query = (
+            self._db.query(
+                Expense.category,
+                func.sum(Expense.amount).label('total_amount'),
+                func.count(Expense.id).label('transaction_count'),
+            )
             .filter(
                 and_(
-                    extract('year', Expense.date) == year,
-                    extract('month', Expense.date) == month,
+                    Expense.user_id == user_id,
+                    Expense.date >= month_start,
+                    Expense.date < next_month_start,
                 )
             )
-            .order_by(desc(Expense.date))
-            .all()
+            .group_by(Expense.category)
+        )
+        return self._cached(
+            (user_id, "month_category_totals", year, month),
+            SUMMARY_CACHE_TTL_SECONDS,
+            query.all,
         )
 
-    def list_recurring(self, user_id: UUID) -> List[Expense]:
-        """Return all recurring expenses for a user."""
-        return (
-            self._base_query(user_id)
-            .filter(Expense.is_recurring.is_(True))
+    def list_recurring(self, user_id: UUID) -> List[Row]:
+        """Return rows of the ``ExpenseOut`` columns for recurring expenses."""
+        return self._db.execute(
+            select(*EXPENSE_OUT_COLUMNS)
+            .where(Expense.user_id == user_id, Expense.is_recurring.is_(True))
             .order_by(desc(Expense.date))
-            .all()
-        )
+        ).all()
 
     def top_transactions(
         self,
@@ -146,56 +372,160 @@ class ExpenseRepository:
         *,
         start_date: datetime,
         limit: int,
-    ) -> List[Expense]:
-        """Return the top ``limit`` transactions after ``start_date``."""
-        return (
-            self._base_query(user_id)
-            .filter(Expense.date >= start_date)
+    ) -> List[Row]:
+        """Return (id, amount, category, merchant, description, date) rows of
+        the top ``limit`` transactions after ``start_date``."""
+        return self._db.execute(
+            select(
+                Expense.id,
+                _round2(Expense.amount).label('amount'),
+                Expense.category,
+                Expense.merchant,
+                Expense.description,
+                Expense.date,
+            )
+            .where(Expense.user_id == user_id, Expense.date >= start_date)
             .order_by(desc(Expense.amount))
             .limit(limit)
-            .all()
-        )
+        ).all()
 
     def category_breakdown(
         self,
         user_id: UUID,
         *,
-        start_date: datetime,
-        end_date: datetime,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
     ) -> List[Tuple[str, float, int]]:
-        """Return total and count per category between the provided dates."""
+        """Return total and count per category between the provided dates, largest first."""
         rows: Sequence[Tuple[str, float, int]] = (
             self._db.query(
                 Expense.category,
                 func.sum(Expense.amount).label('total_amount'),
                 func.count(Expense.id).label('transaction_count'),
             )
-            .filter(
-                and_(
-                    Expense.user_id == user_id,
-                    Expense.date >= start_date,
-                    Expense.date <= end_date,
-                )
-            )
+            .filter(*self._date_range(user_id, start_date, end_date))
             .group_by(Expense.category)
+            .order_by(desc('total_amount'))
             .all()
         )
         return list(rows)
 
+    def category_shares(
+        self,
+        user_id: UUID,
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tuple[str, float, int, float]]:
+        """Return (category, total, count, percentage) rows, largest first.
+
+        The percentage of the overall total is computed in the same query
+        with a window ``SUM`` over the grouped sums, and rows come back
+        already sorted. Results are cached per user and range until the
+        user's next expense write.
+        """
+        return self._cached(
+            (user_id, "category_shares", start_date, end_date),
+            SUMMARY_CACHE_TTL_SECONDS,
+            lambda: self._category_shares(user_id, start_date, end_date),
+        )
+
+    def _category_shares(
+        self,
+        user_id: UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> List[Tuple[str, float, int, float]]:
+        if settings.expense_rollup_enabled and start_date is None and end_date is None:
+            return self._rollup_shares(ExpenseRollup.user_id == user_id)
+        total_amount = func.sum(Expense.amount)
+        rows = (
+            self._db.query(
+                Expense.category,
+                _round2(total_amount).label('total_amount'),
+                func.count(Expense.id).label('transaction_count'),
+                _round2(total_amount * 100.0 / func.nullif(func.sum(total_amount).over(), 0)).label('percentage'),
+            )
+            .filter(*self._date_range(user_id, start_date, end_date))
+            .group_by(Expense.category)
+            .order_by(desc('total_amount'))
+            .all()
+        )
+        return [(row[0], row[1], row[2], row[3] or 0.0) for row in rows]
+
+    def _rollup_shares(self, *criteria) -> List[Tuple[str, float, int, float]]:
+        """Category shares summed from ``expense_rollup`` rows."""
+        total_amount = func.sum(ExpenseRollup.total_amount)
+        rows = (
+            self._db.query(
+                ExpenseRollup.category,
+                _round2(total_amount).label('total_amount'),
+                func.sum(ExpenseRollup.transaction_count),
+                _round2(total_amount * 100.0 / func.nullif(func.sum(total_amount).over(), 0)),
+            )
+            .filter(*criteria)
+            .group_by(ExpenseRollup.category)
+            .having(func.sum(ExpenseRollup.transaction_count) > 0)
+            .order_by(desc('total_amount'))
+            .all()
+        )
+        return [(row[0], row[1], int(row[2]), row[3] or 0.0) for row in rows]
+
+    def summary_totals(
+        self,
+        user_id: UUID,
+        *,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Tuple[float, int, Optional[datetime], Optional[datetime]]:
+        """Return (total, count, first date, last date) for the period in one query."""
+        return (
+            self._db.query(
+                func.coalesce(func.sum(Expense.amount), 0.0),
+                func.count(Expense.id),
+                func.min(Expense.date),
+                func.max(Expense.date),
+            )
+            .filter(*self._date_range(user_id, start_date, end_date))
+            .one()
+        )
+
     def category_totals_by_month(
         self,
         user_id: UUID,
         *,
         start_date: datetime,
         end_date: datetime,
-    ) -> List[Tuple[int, int, str, float]]:
-        """Return (year, month, category, total) tuples across a range."""
-        rows: Sequence[Tuple[int, int, str, float]] = (
+    ) -> List[Tuple[int, int, str, float, float]]:
+        """Return (year, month, category, total, percentage of month) tuples.
+
+        The percentage is a window over the month's category sums, so both
+        values arrive rounded to two decimals. Results are cached per user
+        and range.
+        """
+        return self._cached(
+            (user_id, "category_totals_by_month", start_date, end_date),
+            DASHBOARD_CACHE_TTL_SECONDS,
+            lambda: self._category_totals_by_month(user_id, start_date, end_date),
+        )
+
+    def _category_totals_by_month(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[Tuple[int, int, str, float, float]]:
+        year = extract('year', Expense.date)
+        month = extract('month', Expense.date)
+        total_amount = func.sum(Expense.amount)
+        month_total = func.sum(total_amount).over(partition_by=(year, month))
+        rows: Sequence[Tuple[int, int, str, float, float]] = (
             self._db.query(
-                extract('year', Expense.date).label('year'),
-                extract('month', Expense.date).label('month'),
+                year.label('year'),
+                month.label('month'),
                 Expense.category,
-                func.sum(Expense.amount).label('total_amount'),
+                _round2(total_amount).label('total_amount'),
+                func.coalesce(_round2(total_amount * 100.0 / func.nullif(month_total, 0)), 0.0).label('percentage'),
             )
             .filter(
                 and_(
@@ -205,6 +535,7 @@ class ExpenseRepository:
                 )
             )
             .group_by('year', 'month', Expense.category)
+            .order_by('year', 'month', desc('total_amount'))
             .all()
         )
         return list(rows)
@@ -214,13 +545,33 @@ class ExpenseRepository:
         user_id: UUID,
         *,
         start_date: datetime,
-        group_expression,
+        bucket: str,
     ) -> List[Tuple[object, float, int]]:
-        """Return aggregated spend trend data grouped by ``group_expression``."""
+        """Return (bucket start, total, count) rows since ``start_date``.
+
+        ``bucket`` is ``"day"``, ``"week"`` or ``"month"``. Results are cached
+        per user, start date and bucket.
+        """
+        return self._cached(
+            (user_id, "spend_trend", start_date, bucket),
+            DASHBOARD_CACHE_TTL_SECONDS,
+            lambda: self._spend_trend(user_id, start_date, bucket),
+        )
+
+    def _spend_trend(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        bucket: str,
+    ) -> List[Tuple[object, float, int]]:
+        if bucket == "day":
+            group_expression = func.date(Expense.date)
+        else:
+            group_expression = func.date_trunc(bucket, Expense.date)
         rows: Sequence[Tuple[object, float, int]] = (
             self._db.query(
                 group_expression.label('period'),
-                func.sum(Expense.amount).label('total_amount'),
+                _round2(func.sum(Expense.amount)).label('total_amount'),
                 func.count(Expense.id).label('transaction_count'),
             )
             .filter(
@@ -235,25 +586,39 @@ class ExpenseRepository:
         )
         return list(rows)
 
-    def sum_amount(
+    def split_period_totals(
         self,
         user_id: UUID,
         *,
         start_date: datetime,
+        split_date: datetime,
         end_date: datetime,
-    ) -> float:
-        """Return the sum of amounts for a user in period."""
-        return (
-            self._db.query(func.sum(Expense.amount))
-            .filter(
-                and_(
-                    Expense.user_id == user_id,
-                    Expense.date >= start_date,
-                    Expense.date <= end_date,
-                )
+    ) -> Tuple[float, float]:
+        """Return (sum before ``split_date``, sum from ``split_date``) in one scan.
+
+        Both sums come from conditional aggregates over the single range
+        ``start_date``..``end_date``. Results are cached per user and range.
+        """
+        query = self._db.query(
+            func.coalesce(
+                func.sum(case((Expense.date < split_date, Expense.amount), else_=0.0)),
+                0.0,
+            ),
+            func.coalesce(
+                func.sum(case((Expense.date >= split_date, Expense.amount), else_=0.0)),
+                0.0,
+            ),
+        ).filter(
+            and_(
+                Expense.user_id == user_id,
+                Expense.date >= start_date,
+                Expense.date <= end_date,
             )
-            .scalar()
-            or 0.0
+        )
+        return self._cached(
+            (user_id, "split_period_totals", start_date, split_date, end_date),
+            SUMMARY_CACHE_TTL_SECONDS,
+            lambda: tuple(query.one()),
         )
 
     def expenses_for_ai(
@@ -284,5 +649,84 @@ class ExpenseRepository:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @staticmethod
+    def _date_range(
+        user_id: UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> List[object]:
+        conditions = [Expense.user_id == user_id]
+        if start_date:
+            conditions.append(Expense.date >= start_date)
+        if end_date:
+            conditions.append(Expense.date <= end_date)
+        return conditions
+
+    @staticmethod
+    def _apply_list_filters(
+        stmt: StatementLambdaElement,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        category: Optional[str],
+        min_amount: Optional[float],
+        max_amount: Optional[float],
+        search: Optional[str],
+    ) -> StatementLambdaElement:
+        if start_date:
+            stmt += lambda s: s.where(Expense.date >= start_date)
+        if end_date:
+            stmt += lambda s: s.where(Expense.date <= end_date)
+        if category:
+            stmt += lambda s: s.where(Expense.category == category)
+        if min_amount is not None:
+            stmt += lambda s: s.where(Expense.amount >= min_amount)
+        if max_amount is not None:
+            stmt += lambda s: s.where(Expense.amount <= max_amount)
+        if search:
+            terms = _SEARCH_TERM_RE.findall(search)
+            if terms:
+                # Prefix-match every word against the GIN-indexed search_doc
+                query_text = " & ".join(f"{term}:*" for term in terms)
+                stmt += lambda s: s.where(
+                    Expense.search_doc.op("@@")(func.to_tsquery("simple", query_text))
+                )
+            else:
+                like_pattern = f"%{search}%"
+                stmt += lambda s: s.where(
+                    or_(
+                        Expense.description.ilike(like_pattern),
+                        Expense.merchant.ilike(like_pattern),
+                        Expense.subcategory.ilike(like_pattern),
+                    )
+                )
+        return stmt
+
+    @staticmethod
+    def _cached(key: tuple, ttl: float, compute: Callable[[], T]) -> T:
+        """Return ``compute()``, reusing a result cached under ``key`` within ``ttl``.
+
+        ``key[0]`` must be the user id. The user's generation is read before
+        computing, so a result computed across a concurrent write is stored
+        under the superseded generation and never served.
+        """
+        if not settings.expense_cache_enabled:
+            return compute()
+        now = time.monotonic()
+        with _user_cache_lock:
+            key = (*key, _user_generations.get(key[0], 0))
+            cached = _user_cache.get(key)
+            if cached is not None:
+                if now - cached[0] < ttl:
+                    _user_cache.move_to_end(key)
+                    return cached[1]
+                del _user_cache[key]
+        value = compute()
+        with _user_cache_lock:
+            _user_cache[key] = (now, value)
+            _user_cache.move_to_end(key)
+            while len(_user_cache) > USER_CACHE_MAX_ENTRIES:
+                _user_cache.popitem(last=False)
+        return value
+
     def _base_query(self, user_id: UUID):
         return self._db.query(Expense).filter(Expense.user_id == user_id)
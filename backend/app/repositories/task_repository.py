@@ -1,15 +1,82 @@
 """Data access helpers for task domain."""
 from __future__ import annotations
 
-from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, date, timedelta
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, case, delete, desc, func, insert, literal_column, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, raiseload
 
 from app.models.models import Task
 
+# Sort key of the task list: (due_date, priority rank, created_at, id), all
+# descending. A missing due_date sorts last, so it is keyed as -infinity.
+TaskCursor = Tuple[Optional[datetime], int, datetime, UUID]
+
+# Columns serialized by ``TaskOut``; list endpoints select just these.
+TASK_OUT_COLUMNS = (
+    Task.id,
+    Task.user_id,
+    Task.title,
+    Task.description,
+    Task.due_date,
+    Task.priority,
+    Task.status,
+    Task.is_completed,
+    Task.completion_date,
+    Task.estimated_duration,
+    Task.actual_duration,
+    Task.tags,
+    Task.parent_task_id,
+    Task.created_at,
+    Task.updated_at,
+)
+
+PRIORITY_RANK = {"high": 2, "medium": 1, "low": 0}
+_NO_DUE_DATE = literal_column("'-infinity'::timestamptz")
+_DUE_DATE_KEY = func.coalesce(Task.due_date, _NO_DUE_DATE)
+_PRIORITY_KEY = case(
+    (Task.priority == "high", PRIORITY_RANK["high"]),
+    (Task.priority == "medium", PRIORITY_RANK["medium"]),
+    else_=PRIORITY_RANK["low"],
+)
+
+# Fixed-shape listings are built once; only the bound values change per call,
+# so every request hits the same compiled-statement cache entry.
+TODAY_TASKS_STMT = (
+    select(*TASK_OUT_COLUMNS)
+    .where(
+        Task.user_id == bindparam("user_id"),
+        Task.due_date >= bindparam("day_start"),
+        Task.due_date < bindparam("day_end"),
+        Task.status != "completed",
+    )
+    .order_by(_PRIORITY_KEY.desc(), Task.created_at.desc())
+)
+
+OVERDUE_TASKS_STMT = (
+    select(*TASK_OUT_COLUMNS)
+    .where(
+        Task.user_id == bindparam("user_id"),
+        Task.due_date < bindparam("now"),
+        Task.status != "completed",
+    )
+    # Show most recently due tasks first so the latest unfinished items appear at the top
+    .order_by(Task.due_date.desc())
+)
+
+
+def _day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """Return the half-open ``[start, end)`` datetime range covering ``day``.
+
+    Range predicates keep the timestamp columns sargable, unlike ``DATE()``.
+    """
+    day_start = datetime.combine(day, datetime.min.time())
+    return day_start, day_start + timedelta(days=1)
+
 
 class TaskRepository:
     def __init__(self, db: Session) -> None:
@@ -31,16 +98,27 @@ class TaskRepository:
         search: Optional[str] = None,
         page: int = 1,
         limit: int = 50,
-    ) -> Tuple[List[Task], int]:
-        """Return paginated tasks plus total count for current filters."""
-        query = self._base_query(user_id)
+        after: Optional[TaskCursor] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[Row], Optional[int], Optional[TaskCursor]]:
+        """Return a page of task rows, the total count and the next-page cursor.
+
+        Rows carry only the ``TaskOut`` columns and are not ORM instances, so
+        no identity-map bookkeeping is done for them.
+
+        When ``after`` is given the page is located with a keyset seek on the
+        sort key instead of ``OFFSET``, and ``page`` is ignored. The total is
+        only counted when ``include_total`` is set; otherwise it is ``None``.
+        """
+        query = self._row_query(user_id)
 
         if status_filter:
             query = query.filter(Task.status == status_filter)
         if priority:
             query = query.filter(Task.priority == priority)
         if due_date:
-            query = query.filter(func.date(Task.due_date) == due_date.date())
+            day_start, day_end = _day_bounds(due_date.date())
+            query = query.filter(Task.due_date >= day_start, Task.due_date < day_end)
         if start_date and end_date:
             query = query.filter(and_(Task.due_date >= start_date, Task.due_date <= end_date))
         elif start_date:
@@ -48,93 +126,129 @@ class TaskRepository:
         elif end_date:
             query = query.filter(Task.due_date <= end_date)
         if tags:
-            tag_conditions = [Task.tags.like(f'%"{tag}"%') for tag in tags]
-            query = query.filter(or_(*tag_conditions))
+            query = query.filter(self._tags_filter(tags))
         if search:
             like_pattern = f"%{search}%"
             query = query.filter(or_(Task.title.ilike(like_pattern), Task.description.ilike(like_pattern)))
 
-        total = query.count()
+        total = query.count() if include_total else None
+
+        if after is not None:
+            after_due_date, after_rank, after_created_at, after_id = after
+            query = query.filter(
+                tuple_(_DUE_DATE_KEY, _PRIORITY_KEY, Task.created_at, Task.id)
+                < tuple_(
+                    after_due_date if after_due_date is not None else _NO_DUE_DATE,
+                    after_rank,
+                    after_created_at,
+                    after_id,
+                )
+            )
+            offset = 0
+        else:
+            offset = (page - 1) * limit
+
         tasks = (
             query.order_by(
-                Task.due_date.desc().nullslast(),
-                desc(Task.priority == "high"),
-                desc(Task.priority == "medium"),
-                Task.created_at.desc(),
+                desc(_DUE_DATE_KEY),
+                desc(_PRIORITY_KEY),
+                desc(Task.created_at),
+                desc(Task.id),
             )
-            .offset((page - 1) * limit)
-            .limit(limit)
+            .offset(offset)
+            .limit(limit + 1)
             .all()
         )
-        return tasks, total
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            last = tasks[-1]
+            next_cursor = (last.due_date, PRIORITY_RANK[last.priority], last.created_at, last.id)
+        return tasks, total, next_cursor
 
     def get_by_id(self, user_id: UUID, task_id: UUID) -> Optional[Task]:
         """Return a single task for the user or None."""
         return self._base_query(user_id).filter(Task.id == task_id).first()
 
-    def create(self, user_id: UUID, payload: Dict[str, object]) -> Task:
-        """Persist a new task and return it."""
-        task = Task(user_id=user_id, **payload)
-        self._db.add(task)
+    def create(self, user_id: UUID, payload: Dict[str, object]) -> Row:
+        """Persist a new task and return its ``TaskOut`` columns.
+
+        ``INSERT ... RETURNING`` hands back the server defaults with the
+        insert itself, so no follow-up refresh SELECT is needed.
+        """
+        stmt = insert(Task).values(user_id=user_id, **payload).returning(*TASK_OUT_COLUMNS)
+        task = self._db.execute(stmt).one()
         self._db.commit()
-        self._db.refresh(task)
         return task
 
-    def update(self, task: Task, update_data: Dict[str, object]) -> Task:
-        """Apply field updates to an existing task."""
-        for key, value in update_data.items():
-            setattr(task, key, value)
+    def update(self, task: Task, update_data: Dict[str, object]) -> Union[Task, Row]:
+        """Apply field updates to an existing task and return its new state.
+
+        ``UPDATE ... RETURNING`` yields the ``TaskOut`` columns, including the
+        server-side ``updated_at``, so no refresh SELECT follows the commit.
+        """
+        if not update_data:
+            return task
+        stmt = (
+            update(Task)
+            .where(Task.id == task.id)
+            .values(**update_data)
+            .returning(*TASK_OUT_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+        updated = self._db.execute(stmt).one()
         self._db.commit()
-        self._db.refresh(task)
-        return task
+        return updated
 
-    def delete(self, task: Task, *, delete_subtasks: bool = True) -> None:
-        """Delete a task (and optionally its subtasks)."""
+    def delete(self, user_id: UUID, task_id: UUID, *, delete_subtasks: bool = True) -> bool:
+        """Delete a task (and optionally its subtasks) in one statement.
+
+        Deeper descendants go with them through the ``ON DELETE CASCADE``
+        foreign key. Returns ``False`` when the task does not exist for the
+        user.
+        """
+        target = Task.id == task_id
         if delete_subtasks:
-            self._db.query(Task).filter(Task.parent_task_id == task.id).delete()
-        self._db.delete(task)
+            target = or_(target, Task.parent_task_id == task_id)
+        stmt = (
+            delete(Task)
+            .where(Task.user_id == user_id, target)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted_ids = self._db.execute(stmt).scalars().all()
+        if task_id not in deleted_ids:
+            self._db.rollback()
+            return False
         self._db.commit()
+        return True
 
     # ------------------------------------------------------------------
     # Domain-specific helpers
     # ------------------------------------------------------------------
-    def list_today(self, user_id: UUID) -> List[Task]:
-        today = date.today()
-        return (
-            self._base_query(user_id)
-            .filter(func.date(Task.due_date) == today, Task.status != "completed")
-            .order_by(
-                desc(Task.priority == "high"),
-                desc(Task.priority == "medium"),
-                Task.created_at.desc(),
-            )
-            .all()
-        )
+    def list_today(self, user_id: UUID) -> List[Row]:
+        day_start, day_end = _day_bounds(date.today())
+        params = {"user_id": user_id, "day_start": day_start, "day_end": day_end}
+        return self._db.execute(TODAY_TASKS_STMT, params).all()
 
     def completed_today_count(self, user_id: UUID) -> int:
-        today = date.today()
+        day_start, day_end = _day_bounds(date.today())
         return (
             self._base_query(user_id)
             .filter(
                 Task.is_completed.is_(True),
-                Task.completion_date.isnot(None),
-                func.date(Task.completion_date) == today,
+                Task.completion_date >= day_start,
+                Task.completion_date < day_end,
             )
             .count()
         )
 
-    def list_overdue(self, user_id: UUID) -> List[Task]:
-        now = datetime.now()
-        return (
-            self._base_query(user_id)
-            .filter(Task.due_date < now, Task.status != "completed")
-            # Show most recently due tasks first so the latest unfinished items appear at the top
-            .order_by(Task.due_date.desc())
-            .all()
-        )
+    def list_overdue(self, user_id: UUID) -> List[Row]:
+        params = {"user_id": user_id, "now": datetime.now()}
+        return self._db.execute(OVERDUE_TASKS_STMT, params).all()
 
     def list_for_insights(self, user_id: UUID) -> List[Task]:
-        return self._base_query(user_id).all()
+        return self._read_query(user_id).all()
 
     # ------------------------------------------------------------------
     # Transaction helpers
@@ -147,3 +261,27 @@ class TaskRepository:
     # ------------------------------------------------------------------
     def _base_query(self, user_id: UUID):
         return self._db.query(Task).filter(Task.user_id == user_id)
+
+    def _read_query(self, user_id: UUID):
+        """Base query for read-only listings.
+
+        ``TaskOut`` and the insights only read columns, so relationship
+        access is made to raise rather than silently issue one lazy
+        SELECT per row.
+        """
+        return self._base_query(user_id).options(raiseload("*"))
+
+    def _tags_filter(self, tags: List[str]):
+        """Match tasks carrying any of ``tags``.
+
+        On PostgreSQL this is a single ``tags ?| ARRAY[...]`` predicate that the
+        GIN index on ``tasks.tags`` can serve; other dialects fall back to
+        matching the serialized JSON text.
+        """
+        if self._db.get_bind().dialect.name == "postgresql":
+            return Task.tags.has_any(array(tags))
+        return or_(*[Task.tags.like(f'%"{tag}"%') for tag in tags])
+
+    def _row_query(self, user_id: UUID):
+        """Query of the ``TaskOut`` columns as plain rows."""
+        return self._db.query(*TASK_OUT_COLUMNS).filter(Task.user_id == user_id)
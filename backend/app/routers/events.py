@@ -10,6 +10,7 @@ from app.schemas.events import (
     MessageResponse, EventParseResponse, AIEventParseRequest, AIEventParseResponse
 )
 from app.models.models import User
+from app.utils.responses import list_response
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -51,12 +52,7 @@ def get_events(
         page=page,
         limit=limit,
     )
-    return {
-        "success": True,
-        "data": result["data"],
-        "message": "Events retrieved successfully",
-        "meta": result["meta"]
-    }
+    return list_response(result, "Events retrieved successfully")
 
 
 @router.post(
@@ -94,12 +90,7 @@ def get_upcoming_events(
     """Get upcoming events for the next N days"""
     try:
         result = facade.get_upcoming_events(days)
-        return {
-            "success": True,
-            "data": result["data"],
-            "message": "Upcoming events retrieved successfully",
-            "meta": result["meta"]
-        }
+        return list_response(result, "Upcoming events retrieved successfully")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
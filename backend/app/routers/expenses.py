@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, Query, UploadFile, File, status, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.core.dependencies import get_current_user
 from app.facades.expense_facade import ExpenseFacade
-from app.repositories.expense_repository import ExpenseRepository
 from app.schemas.expenses import (
     ExpenseCreate, ExpenseUpdate, ExpenseParseRequest, ExpenseBulkImport,
     ExpenseResponse, ExpensesResponse, ExpenseSummaryResponse, 
@@ -13,6 +13,7 @@ from app.schemas.expenses import (
     SpendTrendResponse, TopTransactionsResponse
 )
 from app.models.models import User
+from app.utils.responses import list_response
 from typing import Optional
 from datetime import datetime
 from uuid import UUID
@@ -25,8 +26,8 @@ def get_expense_facade(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user())
 ) -> ExpenseFacade:
-    """Instantiate an expense facade per request."""
-    return ExpenseFacade(ExpenseRepository(db), current_user)
+    """Return the request-scoped expense facade."""
+    return ExpenseFacade.for_session(db, current_user)
 
 
 
@@ -49,10 +50,12 @@ def get_expenses(
     search: Optional[str] = Query(None, description="Search in description, merchant, subcategory"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor; takes precedence over page"),
+    include_total: bool = Query(False, description="Include total/pages in meta (runs an extra COUNT query)"),
     facade: ExpenseFacade = Depends(get_expense_facade)
 ):
     """List expenses with filters"""
-    return facade.get_expenses(
+    result = facade.get_expenses(
         start_date=start_date,
         end_date=end_date,
         category=category,
@@ -61,7 +64,10 @@ def get_expenses(
         search=search,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
+    return list_response(result)
 
 
 @router.post(
@@ -207,30 +213,29 @@ def get_recurring_expenses(
     facade: ExpenseFacade = Depends(get_expense_facade)
 ):
     """Get recurring expenses"""
-    return facade.get_recurring_expenses()
+    return list_response(facade.get_recurring_expenses())
 
 
-# @router.post(
-#     "/bulk",
-#     status_code=status.HTTP_201_CREATED,
-#     response_model=ExpensesResponse,
-#     summary="Bulk import expenses",
-#     description="Import multiple expenses at once"
-# )
-# def bulk_import_expenses(
-#     bulk_data: ExpenseBulkImport,
-#     db: Session = Depends(get_db),
-#     current_user: User = Depends(get_current_user())
-# ):
-#     """Bulk import expenses"""
-#     return ExpenseService.bulk_import_expenses(db, current_user, bulk_data)
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ExpensesResponse,
+    summary="Bulk import expenses",
+    description="Import multiple expenses at once"
+)
+def bulk_import_expenses(
+    bulk_data: ExpenseBulkImport,
+    facade: ExpenseFacade = Depends(get_expense_facade)
+):
+    """Bulk import expenses"""
+    return facade.bulk_import_expenses(bulk_data)
 
 
 @router.get(
     "/export",
     status_code=status.HTTP_200_OK,
     summary="Export expenses",
-    description="Export expenses to CSV or JSON format"
+    description="Export expenses to CSV (streamed as text/csv) or JSON format"
 )
 def export_expenses(
     format: str = Query("csv", enum=["csv", "json"], description="Export format"),
@@ -239,11 +244,18 @@ def export_expenses(
     facade: ExpenseFacade = Depends(get_expense_facade)
 ):
     """Export expenses"""
-    return facade.export_expenses(
+    result = facade.export_expenses(
         format=format,
         start_date=start_date,
         end_date=end_date,
     )
+    if format == "csv":
+        return StreamingResponse(
+            result,
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="expenses.csv"'},
+        )
+    return result
 
 
 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, Query, Path, status, HTTPException, File, UploadFile
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.core.dependencies import get_current_user
@@ -32,13 +33,22 @@ def get_journal_entries(
     search: Optional[str] = Query(None, description="Search in title, content, summary"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    compact: bool = Query(False, description="Omit content and keywords from each entry"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user())
 ):
     """List journal entries with filters"""
     result = JournalService.get_entries(
-        db, current_user, start_date, end_date, mood, search, page, limit
+        db, current_user, start_date, end_date, mood, search, page, limit, compact
     )
+    if compact:
+        # Compact rows do not satisfy JournalEntryOut, so skip response_model
+        return ORJSONResponse(content={
+            "success": True,
+            "data": result["data"],
+            "message": "Journal entries retrieved successfully",
+            "meta": result["meta"]
+        })
     return {
         "success": True,
         "data": result["data"],
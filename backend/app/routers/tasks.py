@@ -3,13 +3,13 @@ from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.core.dependencies import get_current_user
 from app.facades.task_facade import TaskFacade
-from app.repositories.task_repository import TaskRepository
 from app.schemas.tasks import (
     TaskCreate, TaskUpdate, TaskParseRequest, TaskCompleteRequest,
     TaskResponse, TasksResponse, MessageResponse, TaskParseResponse,
     TaskPriority, TaskStatus, AITaskParseRequest, AITaskParseResponse, TaskStatsResponse
 )
 from app.models.models import User
+from app.utils.responses import list_response
 from typing import Optional, List
 from datetime import datetime
 from uuid import UUID
@@ -23,8 +23,8 @@ def get_task_facade(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user())
 ) -> TaskFacade:
-    """Instantiate a task facade per request."""
-    return TaskFacade(TaskRepository(db), current_user)
+    """Return the request-scoped task facade."""
+    return TaskFacade.for_session(db, current_user)
 
 
 @router.get(
@@ -44,10 +44,12 @@ def get_tasks(
     search: Optional[str] = Query(None, description="Search in title and description"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor; takes precedence over page"),
+    include_total: bool = Query(False, description="Include total/pages in meta (runs an extra COUNT query)"),
     facade: TaskFacade = Depends(get_task_facade),
 ):
     """List tasks with filters"""
-    return facade.get_tasks(
+    return list_response(facade.get_tasks(
         status_filter=status_filter,
         priority=priority,
         due_date=due_date,
@@ -57,7 +59,9 @@ def get_tasks(
         search=search,
         page=page,
         limit=limit,
-    )
+        cursor=cursor,
+        include_total=include_total,
+    ))
 
 
 @router.post(
@@ -86,7 +90,7 @@ def get_today_tasks(
     facade: TaskFacade = Depends(get_task_facade),
 ):
     """Get today's tasks"""
-    return facade.get_today_tasks()
+    return list_response(facade.get_today_tasks())
 
 @router.get(
     "/stats/today",
@@ -113,7 +117,7 @@ def get_overdue_tasks(
     facade: TaskFacade = Depends(get_task_facade),
 ):
     """Get overdue tasks"""
-    return facade.get_overdue_tasks()
+    return list_response(facade.get_overdue_tasks())
 
 
 @router.get(
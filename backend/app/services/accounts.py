@@ -1,3 +1,5 @@
+import uuid
+
 from sqlalchemy.orm import Session
 from app.models.models import User
 from app.utils.responses import ResponseHandler
@@ -8,7 +10,6 @@ class AccountService:
     @staticmethod
     def get_my_info(db: Session, token):
         user_id = get_token_payload(token.credentials).get('id')
-        import uuid
         user_uuid = uuid.UUID(user_id)
         user = db.query(User).filter(User.id == user_uuid).first()
         if not user:
@@ -18,7 +19,6 @@ class AccountService:
     @staticmethod
     def edit_my_info(db: Session, token, updated_user):
         user_id = get_token_payload(token.credentials).get('id')
-        import uuid
         user_uuid = uuid.UUID(user_id)
         db_user = db.query(User).filter(User.id == user_uuid).first()
         if not db_user:
@@ -34,7 +34,6 @@ class AccountService:
     @staticmethod
     def remove_my_account(db: Session, token):
         user_id = get_token_payload(token.credentials).get('id')
-        import uuid
         user_uuid = uuid.UUID(user_id)
         db_user = db.query(User).filter(User.id == user_uuid).first()
         if not db_user:
@@ -1,3 +1,5 @@
+import uuid
+
 from fastapi import HTTPException, Depends, status
 from fastapi.security.oauth2 import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
@@ -93,7 +95,6 @@ class AuthService:
             raise ResponseHandler.invalid_token('refresh')
 
         # Convert string ID back to UUID for database query
-        import uuid
         user_uuid = uuid.UUID(user_id)
         user = db.query(User).filter(User.id == user_uuid).first()
         if not user:
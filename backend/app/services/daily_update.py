@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
 from fastapi import HTTPException, status
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 import json
 
@@ -464,7 +464,7 @@ class DailyUpdateService:
             status=data.get("status", "pending"),
             is_completed=data.get("is_completed", False),
             estimated_duration=data.get("estimated_duration"),
-            tags=json.dumps(data.get("tags", [])) if data.get("tags") else None,
+            tags=data.get("tags") or None,
             parent_task_id=data.get("parent_task_id")
         )
         
@@ -489,7 +489,7 @@ class DailyUpdateService:
             date=data.get("date") or datetime.utcnow(),
             payment_method=data.get("payment_method"),
             is_recurring=data.get("is_recurring", False),
-            tags=json.dumps(data.get("tags", [])) if data.get("tags") else None
+            tags=data.get("tags") or None
         )
         
         db.add(expense)
@@ -513,7 +513,6 @@ class DailyUpdateService:
             end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
         
         if end_time <= start_time:
-            from datetime import timedelta
             end_time = start_time + timedelta(hours=1)
         
         event = Event(
@@ -1,15 +1,39 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, extract, func, desc, or_
+from sqlalchemy import Integer, and_, cast, extract, func, desc, or_
 from fastapi import HTTPException, status
 from app.models.models import JournalEntry, User
 from app.schemas.journal import JournalEntryCreate, JournalEntryUpdate, JournalEntryOut, JournalParseRequest
 from typing import List, Optional
-from datetime import datetime, date, timedelta
+from datetime import datetime, timedelta
+import asyncio
 import json
+import re
+import subprocess
 from uuid import UUID
 import calendar
 
 
+SEARCH_TERM_RE = re.compile(r"\w+")
+
+# Columns returned by the compact journal list (everything but the large
+# ``content`` and ``keywords`` fields)
+JOURNAL_COMPACT_COLUMNS = (
+    JournalEntry.id,
+    JournalEntry.user_id,
+    JournalEntry.title,
+    JournalEntry.mood,
+    JournalEntry.sentiment_score,
+    JournalEntry.summary,
+    JournalEntry.weather,
+    JournalEntry.location,
+    JournalEntry.created_at,
+    JournalEntry.updated_at,
+)
+
+# Sample rate the voice upload is decoded to before speech recognition
+VOICE_SAMPLE_RATE = 16000
+
+
 class JournalService:
     
     @staticmethod
@@ -21,10 +45,20 @@ class JournalService:
         mood: Optional[str] = None,
         search: Optional[str] = None,
         page: int = 1,
-        limit: int = 50
+        limit: int = 50,
+        compact: bool = False
     ) -> dict:
-        """Get journal entries with filters and pagination"""
-        query = db.query(JournalEntry).filter(JournalEntry.user_id == user.id)
+        """Get journal entries with filters and pagination.
+        
+        With ``compact`` the page is selected as plain rows without the
+        ``content`` and ``keywords`` columns, for list views that only need
+        the entry headers.
+        """
+        if compact:
+            query = db.query(*JOURNAL_COMPACT_COLUMNS)
+        else:
+            query = db.query(JournalEntry)
+        query = query.filter(JournalEntry.user_id == user.id)
         
         # Apply filters
         if start_date:
@@ -34,23 +68,44 @@ class JournalService:
         if mood:
             query = query.filter(JournalEntry.mood == mood)
         if search:
-            query = query.filter(
-                or_(
-                    JournalEntry.title.ilike(f"%{search}%"),
-                    JournalEntry.content.ilike(f"%{search}%"),
-                    JournalEntry.summary.ilike(f"%{search}%")
+            terms = SEARCH_TERM_RE.findall(search)
+            if terms:
+                # Prefix-match every word against the GIN-indexed search_doc
+                query = query.filter(
+                    JournalEntry.search_doc.op('@@')(
+                        func.to_tsquery('english', ' & '.join(f"{term}:*" for term in terms))
+                    )
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        JournalEntry.title.ilike(f"%{search}%"),
+                        JournalEntry.content.ilike(f"%{search}%"),
+                        JournalEntry.summary.ilike(f"%{search}%")
+                    )
                 )
-            )
         
         # Order by creation date (newest first)
         query = query.order_by(desc(JournalEntry.created_at))
         
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
+        # Apply pagination; the total rides along as a window count so the
+        # filtered set is only scanned once
         offset = (page - 1) * limit
-        entries = query.offset(offset).limit(limit).all()
+        rows = query.add_columns(
+            func.count().over().label('total_count')
+        ).offset(offset).limit(limit).all()
+        if compact:
+            entries = [row._asdict() for row in rows]
+            for entry in entries:
+                del entry['total_count']
+        else:
+            entries = [entry for entry, _ in rows]
+        
+        if rows:
+            total = rows[0].total_count
+        else:
+            # Past the last page there is no row to carry the window count
+            total = query.order_by(None).count() if page > 1 else 0
         
         # Calculate pagination info
         total_pages = (total + limit - 1) // limit
@@ -94,11 +149,10 @@ class JournalService:
     @staticmethod
     def get_entry_by_id(db: Session, user: User, entry_id: UUID) -> JournalEntry:
         """Get a specific journal entry by ID"""
-        entry = db.query(JournalEntry).filter(
-            and_(JournalEntry.id == entry_id, JournalEntry.user_id == user.id)
-        ).first()
+        # Primary-key lookup that reuses the identity map; ownership checked here
+        entry = db.get(JournalEntry, entry_id)
         
-        if not entry:
+        if entry is None or entry.user_id != user.id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Journal entry not found"
@@ -133,8 +187,17 @@ class JournalService:
     @staticmethod
     def delete_entry(db: Session, user: User, entry_id: UUID) -> bool:
         """Delete a journal entry"""
-        entry = JournalService.get_entry_by_id(db, user, entry_id)
-        db.delete(entry)
+        deleted = db.query(JournalEntry).filter(
+            JournalEntry.id == entry_id,
+            JournalEntry.user_id == user.id
+        ).delete(synchronize_session=False)
+        
+        if not deleted:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Journal entry not found"
+            )
         db.commit()
         return True
     
@@ -154,39 +217,12 @@ class JournalService:
     @staticmethod
     async def parse_voice_with_ai(db: Session, user: User, audio_file) -> dict:
         """Parse voice recording into journal entry data using AI"""
-        from app.services.ai_service import ai_service
-        import tempfile
-        import os
-        from pydub import AudioSegment
-        import speech_recognition as sr
-        
-        temp_audio_path = ""
-        wav_path = ""
-        
         try:
             # Read audio data
             audio_data = await audio_file.read()
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-                temp_file.write(audio_data)
-                temp_audio_path = temp_file.name
             
-            # Convert to WAV format
-            audio = AudioSegment.from_file(temp_audio_path)
-            wav_path = temp_audio_path.replace(".wav", "_converted.wav")
-            audio.export(wav_path, format="wav")
-            
-            # Transcribe audio
-            recognizer = sr.Recognizer()
-            with sr.AudioFile(wav_path) as source:
-                recorded = recognizer.record(source)
-            
-            try:
-                text = recognizer.recognize_google(recorded)
-            except sr.UnknownValueError:
-                try:
-                    text = recognizer.recognize_sphinx(recorded)
-                except Exception:
-                    raise HTTPException(status_code=400, detail="Could not transcribe audio")
+            # Decoding and recognition block, so keep them off the event loop
+            text = await asyncio.to_thread(JournalService._transcribe, audio_data)
             
             # Parse the transcribed text
             parsed_data = JournalService.parse_natural_language(text)
@@ -206,12 +242,36 @@ class JournalService:
             raise
         except Exception as exc:
             raise HTTPException(status_code=500, detail=f"Voice processing error: {exc}")
-        finally:
-            # Clean up temp files
-            if temp_audio_path and os.path.exists(temp_audio_path):
-                os.unlink(temp_audio_path)
-            if wav_path and os.path.exists(wav_path):
-                os.unlink(wav_path)
+    
+    @staticmethod
+    def _transcribe(audio_data: bytes) -> str:
+        """Decode uploaded audio with a single piped ffmpeg call and transcribe it."""
+        import speech_recognition as sr
+        
+        # Decode straight to 16 kHz mono 16-bit PCM; no temp files involved
+        pcm = subprocess.run(
+            [
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-i", "pipe:0",
+                "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(VOICE_SAMPLE_RATE), "-ac", "1",
+                "pipe:1",
+            ],
+            input=audio_data,
+            capture_output=True,
+            check=True,
+        ).stdout
+        recorded = sr.AudioData(pcm, VOICE_SAMPLE_RATE, 2)
+        
+        # Transcribe audio
+        recognizer = sr.Recognizer()
+        
+        try:
+            return recognizer.recognize_google(recorded)
+        except sr.UnknownValueError:
+            try:
+                return recognizer.recognize_sphinx(recorded)
+            except Exception:
+                raise HTTPException(status_code=400, detail="Could not transcribe audio")
     
     @staticmethod
     def analyze_entries(db: Session, user: User, entry_ids: Optional[List[UUID]] = None) -> dict:
@@ -221,10 +281,8 @@ class JournalService:
         if entry_ids:
             query = query.filter(JournalEntry.id.in_(entry_ids))
         
-        entries = query.all()
-        
         # TODO: Implement AI analysis
-        analyzed_count = len(entries)
+        analyzed_count = query.with_entities(func.count(JournalEntry.id)).scalar()
         
         return {
             "analyzed_entries": analyzed_count,
@@ -234,16 +292,13 @@ class JournalService:
     @staticmethod
     def get_journal_stats(db: Session, user: User) -> dict:
         """Get journaling statistics"""
-        total_entries = db.query(JournalEntry).filter(JournalEntry.user_id == user.id).count()
-        
-        # Get entries this month
+        # Totals, entries this month and average sentiment in one scan
         current_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        entries_this_month = db.query(JournalEntry).filter(
-            and_(
-                JournalEntry.user_id == user.id,
-                JournalEntry.created_at >= current_month
-            )
-        ).count()
+        total_entries, entries_this_month, avg_sentiment = db.query(
+            func.count(JournalEntry.id),
+            func.count(JournalEntry.id).filter(JournalEntry.created_at >= current_month),
+            func.avg(JournalEntry.sentiment_score)
+        ).filter(JournalEntry.user_id == user.id).one()
         
         # Get mood distribution
         mood_stats = db.query(
@@ -253,20 +308,8 @@ class JournalService:
         
         mood_distribution = {mood: count for mood, count in mood_stats if mood}
         
-        # Get average sentiment score
-        avg_sentiment = db.query(func.avg(JournalEntry.sentiment_score)).filter(
-            and_(
-                JournalEntry.user_id == user.id,
-                JournalEntry.sentiment_score.isnot(None)
-            )
-        ).scalar()
-        
         # Calculate longest streak
-        entries_by_date = db.query(
-            func.date(JournalEntry.created_at).label('date')
-        ).filter(JournalEntry.user_id == user.id).distinct().order_by('date').all()
-        
-        longest_streak = JournalService._calculate_longest_streak([entry.date for entry in entries_by_date])
+        longest_streak = JournalService._calculate_longest_streak(db, user.id)
         
         return {
             "total_entries": total_entries,
@@ -314,20 +357,25 @@ class JournalService:
         }
     
     @staticmethod
-    def _calculate_longest_streak(dates: List[date]) -> int:
-        """Calculate the longest consecutive streak of journal entries"""
-        if not dates:
-            return 0
+    def _calculate_longest_streak(db: Session, user_id: UUID) -> int:
+        """Calculate the longest consecutive streak of journal entries.
+
+        Runs entirely in the database: subtracting each distinct entry day's
+        row number from the day gives a constant key within a run of
+        consecutive days, so the longest streak is the largest group.
+        """
+        entry_days = db.query(
+            func.date(JournalEntry.created_at).label('day')
+        ).filter(JournalEntry.user_id == user_id).distinct().subquery()
         
-        dates = sorted(set(dates))  # Remove duplicates and sort
-        longest = 1
-        current = 1
+        streak_key = (
+            entry_days.c.day
+            - cast(func.row_number().over(order_by=entry_days.c.day), Integer)
+        ).label('streak_key')
+        keyed_days = db.query(streak_key).subquery()
         
-        for i in range(1, len(dates)):
-            if (dates[i] - dates[i-1]).days == 1:
-                current += 1
-                longest = max(longest, current)
-            else:
-                current = 1
+        runs = db.query(
+            func.count().label('length')
+        ).select_from(keyed_days).group_by(keyed_days.c.streak_key).subquery()
         
-        return longest
+        return db.query(func.max(runs.c.length)).scalar() or 0
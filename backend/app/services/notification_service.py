@@ -1,11 +1,34 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import event, func, and_
 from fastapi import HTTPException, status
-from app.models.models import User, UserPreferences, Task, Event, Expense, JournalEntry
+from app.models.models import User, UserPreferences, Task, Event, Expense
 from app.schemas.notifications import NotificationSettingsBase, NotificationSettingsUpdate, DailySummary
 from datetime import datetime, timedelta
-from typing import Optional
-import json
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import threading
+import time
+
+# Display formats for summary event times (emails and the preview render
+# these strings as-is)
+EVENT_TODAY_TIME_FORMAT = "%I:%M %p"
+EVENT_WEEK_TIME_FORMAT = "%a, %b %d at %I:%M %p"
+
+# Per-process cache of each user's preferred send time. Any UserPreferences
+# write drops the user's entry, so the TTL only bounds staleness across
+# workers. email_enabled gates sending and is always read from the database.
+SETTINGS_CACHE_TTL_SECONDS = 60.0
+_settings_cache: Dict[UUID, Tuple[float, str]] = {}
+_settings_cache_lock = threading.Lock()
+
+
+@event.listens_for(UserPreferences, "after_insert")
+@event.listens_for(UserPreferences, "after_update")
+@event.listens_for(UserPreferences, "after_delete")
+def _invalidate_settings_cache(_mapper, _connection, target: UserPreferences) -> None:
+    with _settings_cache_lock:
+        _settings_cache.pop(target.user_id, None)
 
 
 class NotificationService:
@@ -13,9 +36,29 @@ class NotificationService:
     @staticmethod
     def get_notification_settings(db: Session, user: User) -> dict:
         """Get user's notification settings from preferences"""
-        preferences = db.query(UserPreferences).filter(
-            UserPreferences.user_id == user.id
-        ).first()
+        with _settings_cache_lock:
+            cached = _settings_cache.get(user.id)
+        if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL_SECONDS:
+            # Only the send time is cached; the opt-in flag is read fresh
+            email_enabled = db.query(
+                UserPreferences.notification_settings['email_enabled'].astext
+            ).filter(UserPreferences.user_id == user.id).scalar()
+            data = {"email_enabled": email_enabled == 'true', "preferred_time": cached[1]}
+        else:
+            data = NotificationService._load_notification_settings(db, user)
+            with _settings_cache_lock:
+                _settings_cache[user.id] = (time.monotonic(), data["preferred_time"])
+        
+        return {
+            "success": True,
+            "data": data,
+            "message": "Notification settings retrieved successfully"
+        }
+    
+    @staticmethod
+    def _load_notification_settings(db: Session, user: User) -> dict:
+        """Resolve the user's notification settings from their preferences"""
+        preferences = user.preferences
         
         # Default settings
         default_settings = NotificationSettingsBase(
@@ -24,27 +67,13 @@ class NotificationService:
         )
         
         if not preferences or not preferences.notification_settings:
-            return {
-                "success": True,
-                "data": default_settings.model_dump(),
-                "message": "Notification settings retrieved successfully"
-            }
+            return default_settings.model_dump()
         
-        # Parse notification_settings from JSONB
         settings_data = preferences.notification_settings
-        if isinstance(settings_data, str):
-            try:
-                settings_data = json.loads(settings_data)
-            except json.JSONDecodeError:
-                settings_data = {}
         
         return {
-            "success": True,
-            "data": {
-                "email_enabled": settings_data.get("email_enabled", False),
-                "preferred_time": settings_data.get("preferred_time", "08:00")
-            },
-            "message": "Notification settings retrieved successfully"
+            "email_enabled": settings_data.get("email_enabled", False),
+            "preferred_time": settings_data.get("preferred_time", "08:00")
         }
     
     @staticmethod
@@ -54,22 +83,15 @@ class NotificationService:
         settings_data: NotificationSettingsUpdate
     ) -> dict:
         """Update user's notification settings"""
-        preferences = db.query(UserPreferences).filter(
-            UserPreferences.user_id == user.id
-        ).first()
+        preferences = user.preferences
         
         if not preferences:
             # Create preferences if they don't exist
             preferences = UserPreferences(user_id=user.id)
             db.add(preferences)
         
-        # Get current notification settings
-        current_settings = preferences.notification_settings or {}
-        if isinstance(current_settings, str):
-            try:
-                current_settings = json.loads(current_settings)
-            except json.JSONDecodeError:
-                current_settings = {}
+        # Get current notification settings (copied so the JSONB change is detected)
+        current_settings = dict(preferences.notification_settings or {})
         
         # Update with new values
         update_data = settings_data.model_dump(exclude_unset=True)
@@ -78,11 +100,10 @@ class NotificationService:
                 current_settings[key] = value
         
         # Save back to preferences
-        preferences.notification_settings = json.dumps(current_settings)
+        preferences.notification_settings = current_settings
         
         try:
             db.commit()
-            db.refresh(preferences)
             
             return {
                 "success": True,
@@ -102,142 +123,159 @@ class NotificationService:
     @staticmethod
     def get_daily_summary(db: Session, user: User) -> DailySummary:
         """Generate daily summary data for a user"""
+        return NotificationService.get_daily_summaries_bulk(db, [user.id])[user.id]
+    
+    @staticmethod
+    def get_daily_email_summaries(db: Session) -> Dict[UUID, DailySummary]:
+        """Generate daily summaries only for users who enabled the email.
+        
+        This is the entry point for the scheduled daily email job, which is
+        not wired up yet. Opted-out users are filtered in SQL (backed by a
+        partial index on email_enabled), so no summary work is done for them.
+        """
+        user_ids = [
+            user_id for (user_id,) in db.query(UserPreferences.user_id).filter(
+                UserPreferences.notification_settings['email_enabled'].astext == 'true'
+            )
+        ]
+        return NotificationService.get_daily_summaries_bulk(db, user_ids)
+    
+    @staticmethod
+    def get_daily_summaries_bulk(db: Session, user_ids: List[UUID]) -> Dict[UUID, DailySummary]:
+        """Generate daily summaries for many users with one query per domain.
+        
+        Tasks, events, expenses and journal entries are each aggregated with a
+        single GROUP BY user_id query, so the number of round-trips does not
+        grow with the number of users.
+        """
+        if not user_ids:
+            return {}
+        
         today = datetime.now().date()
         today_start = datetime.combine(today, datetime.min.time())
-        today_end = datetime.combine(today, datetime.max.time())
         week_start = today - timedelta(days=today.weekday())
         week_start_dt = datetime.combine(week_start, datetime.min.time())
         week_end = today + timedelta(days=7)
         week_end_dt = datetime.combine(week_end, datetime.max.time())
+        tomorrow = today + timedelta(days=1)
+        tomorrow_start = datetime.combine(tomorrow, datetime.min.time())
         
-        # Tasks stats
-        tasks_pending = db.query(Task).filter(
-            Task.user_id == user.id,
-            Task.status != 'completed'
-        ).count()
-        
-        tasks_due_today = db.query(Task).filter(
-            Task.user_id == user.id,
-            Task.status != 'completed',
-            func.date(Task.due_date) == today
-        ).count()
+        # Filled in place from the aggregates below, so validation is skipped
+        summaries = {user_id: DailySummary.model_construct() for user_id in user_ids}
         
-        tasks_overdue = db.query(Task).filter(
-            Task.user_id == user.id,
-            Task.status != 'completed',
-            Task.due_date < today_start
-        ).count()
+        # Tasks stats, including the upcoming week, in one scan
+        open_task = Task.status != 'completed'
+        task_stats = db.query(
+            Task.user_id,
+            func.count().filter(open_task),
+            func.count().filter(and_(
+                open_task,
+                Task.due_date >= today_start,
+                Task.due_date < tomorrow_start
+            )),
+            func.count().filter(and_(open_task, Task.due_date < today_start)),
+            func.count().filter(and_(
+                Task.status == 'completed',
+                Task.completion_date >= today_start,
+                Task.completion_date < tomorrow_start
+            )),
+            func.count().filter(and_(
+                open_task,
+                Task.due_date >= tomorrow_start,
+                Task.due_date <= week_end_dt
+            )),
+        ).filter(Task.user_id.in_(user_ids)).group_by(Task.user_id).all()
         
-        tasks_completed_today = db.query(Task).filter(
-            Task.user_id == user.id,
-            Task.status == 'completed',
-            func.date(Task.completion_date) == today
-        ).count()
+        for user_id, pending, due_today, overdue, completed_today, due_next_week in task_stats:
+            summary = summaries[user_id]
+            summary.tasks_pending = pending
+            summary.tasks_due_today = due_today
+            summary.tasks_overdue = overdue
+            summary.tasks_completed_today = completed_today
+            summary.tasks_due_next_week = due_next_week
         
-        # Events stats
-        events_today_list = db.query(Event).filter(
-            Event.user_id == user.id,
+        # Events stats: the first five of today's and of the next week's
+        # events per user, with each group's full count from the same window
+        is_today = Event.start_time < tomorrow_start
+        ranked_events = db.query(
+            Event.user_id,
+            Event.title,
+            Event.start_time,
+            is_today.label('is_today'),
+            func.row_number().over(
+                partition_by=(Event.user_id, is_today),
+                order_by=Event.start_time
+            ).label('position'),
+            func.count().over(partition_by=(Event.user_id, is_today)).label('total')
+        ).filter(
+            Event.user_id.in_(user_ids),
             and_(
                 Event.start_time >= today_start,
-                Event.start_time <= today_end
+                Event.start_time <= week_end_dt
             )
-        ).order_by(Event.start_time).all()
-        
-        events_today = len(events_today_list)
-        events_upcoming = [
-            {
-                "title": e.title,
-                "start_time": e.start_time.strftime("%I:%M %p") if e.start_time else None
-            }
-            for e in events_today_list[:5]  # Limit to 5 events
-        ]
+        ).subquery()
         
-        # Expenses stats
-        expenses_today = db.query(func.coalesce(func.sum(Expense.amount), 0)).filter(
-            Expense.user_id == user.id,
-            func.date(Expense.date) == today
-        ).scalar() or 0.0
+        event_rows = db.query(ranked_events).filter(
+            ranked_events.c.position <= 5
+        ).order_by(ranked_events.c.user_id, ranked_events.c.start_time).all()
         
-        expenses_this_week = db.query(func.coalesce(func.sum(Expense.amount), 0)).filter(
-            Expense.user_id == user.id,
-            Expense.date >= week_start_dt
-        ).scalar() or 0.0
+        for row in event_rows:
+            summary = summaries[row.user_id]
+            if row.is_today:
+                summary.events_today = row.total
+                summary.events_upcoming.append({
+                    "title": row.title,
+                    "start_time": row.start_time.strftime(EVENT_TODAY_TIME_FORMAT) if row.start_time else None
+                })
+            else:
+                summary.events_next_week = row.total
+                summary.events_next_week_list.append({
+                    "title": row.title,
+                    "start_time": row.start_time.strftime(EVENT_WEEK_TIME_FORMAT) if row.start_time else None
+                })
         
-        # Top expense category this week
-        top_category_result = db.query(
+        # Expenses stats: per-category week totals with today's share, largest
+        # first. Today always falls inside the week, so one grouped scan
+        # yields the week total, today's total and the top category.
+        week_total = func.sum(Expense.amount)
+        category_totals = db.query(
+            Expense.user_id,
             Expense.category,
-            func.sum(Expense.amount).label('total')
+            week_total.label('total'),
+            func.coalesce(
+                func.sum(Expense.amount).filter(and_(
+                    Expense.date >= today_start,
+                    Expense.date < tomorrow_start
+                )), 0.0
+            ).label('today_total')
         ).filter(
-            Expense.user_id == user.id,
+            Expense.user_id.in_(user_ids),
             Expense.date >= week_start_dt
-        ).group_by(Expense.category).order_by(
-            func.sum(Expense.amount).desc()
-        ).first()
-        
-        top_expense_category = top_category_result[0] if top_category_result else None
+        ).group_by(Expense.user_id, Expense.category).order_by(
+            Expense.user_id,
+            week_total.desc()
+        ).all()
         
-        # Journal stats
-        last_journal = db.query(JournalEntry).filter(
-            JournalEntry.user_id == user.id
-        ).order_by(JournalEntry.created_at.desc()).first()
+        for row in category_totals:
+            summary = summaries[row.user_id]
+            if summary.top_expense_category is None:
+                summary.top_expense_category = row.category
+            summary.expenses_today += row.today_total
+            summary.expenses_this_week += row.total
         
-        journal_last_entry_days = None
-        if last_journal:
-            days_diff = (today - last_journal.created_at.date()).days
-            journal_last_entry_days = days_diff
-        
-        # Upcoming week stats (next 7 days)
-        tomorrow = today + timedelta(days=1)
-        tomorrow_start = datetime.combine(tomorrow, datetime.min.time())
-        
-        tasks_due_next_week = db.query(Task).filter(
-            Task.user_id == user.id,
-            Task.status != 'completed',
-            and_(
-                Task.due_date >= tomorrow_start,
-                Task.due_date <= week_end_dt
-            )
-        ).count()
-        
-        events_next_week_list = db.query(Event).filter(
-            Event.user_id == user.id,
-            and_(
-                Event.start_time >= tomorrow_start,
-                Event.start_time <= week_end_dt
-            )
-        ).order_by(Event.start_time).limit(5).all()
-        
-        events_next_week = db.query(Event).filter(
-            Event.user_id == user.id,
-            and_(
-                Event.start_time >= tomorrow_start,
-                Event.start_time <= week_end_dt
-            )
-        ).count()
+        # Journal stats, from the trigger-maintained users.last_journal_at
+        last_journal_rows = db.query(
+            User.id,
+            User.last_journal_at
+        ).filter(
+            User.id.in_(user_ids),
+            User.last_journal_at.isnot(None)
+        ).all()
         
-        events_next_week_formatted = [
-            {
-                "title": e.title,
-                "start_time": e.start_time.strftime("%a, %b %d at %I:%M %p") if e.start_time else None
-            }
-            for e in events_next_week_list
-        ]
+        for user_id, last_journal_at in last_journal_rows:
+            summaries[user_id].journal_last_entry_days = (today - last_journal_at.date()).days
         
-        return DailySummary(
-            tasks_pending=tasks_pending,
-            tasks_due_today=tasks_due_today,
-            tasks_overdue=tasks_overdue,
-            tasks_completed_today=tasks_completed_today,
-            events_today=events_today,
-            events_upcoming=events_upcoming,
-            expenses_today=float(expenses_today),
-            expenses_this_week=float(expenses_this_week),
-            top_expense_category=top_expense_category,
-            journal_last_entry_days=journal_last_entry_days,
-            tasks_due_next_week=tasks_due_next_week,
-            events_next_week=events_next_week,
-            events_next_week_list=events_next_week_formatted
-        )
+        return summaries
     
     @staticmethod
     def get_email_preview(db: Session, user: User) -> dict:
@@ -255,7 +293,8 @@ class NotificationService:
         """Send a test email to the user"""
         from app.services.email_service import EmailService
         
-        summary = NotificationService.get_daily_summary(db, user)
+        # The summary queries are blocking; keep them off the event loop
+        summary = await asyncio.to_thread(NotificationService.get_daily_summary, db, user)
         
         try:
             success = await EmailService.send_daily_summary_email(
@@ -1,3 +1,7 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, UploadFile, status
 from app.models.models import User, UserPreferences
@@ -8,16 +12,29 @@ from app.schemas.users import (
 from app.utils.upload import upload_profile_picture, delete_profile_picture
 from app.utils.responses import ResponseHandler
 from typing import Optional
-import json
 from uuid import UUID
 
 
+_PROFILE_FIELDS = tuple(UserProfileOut.model_fields)
+
+
+def _profile_out(user: User) -> UserProfileOut:
+    """Build ``UserProfileOut`` from a loaded user without re-validating.
+
+    The values come straight from the users table, which already enforces
+    the schema's constraints.
+    """
+    return UserProfileOut.model_construct(
+        **{field: getattr(user, field) for field in _PROFILE_FIELDS}
+    )
+
+
 class UserProfileService:
     
     @staticmethod
     def get_user_profile(user: User) -> dict:
         """Get current user profile"""
-        user_profile = UserProfileOut.model_validate(user)
+        user_profile = _profile_out(user)
         return {
             "success": True,
             "data": user_profile,
@@ -46,7 +63,7 @@ class UserProfileService:
             db.commit()
             db.refresh(user)
             
-            user_profile = UserProfileOut.model_validate(user)
+            user_profile = _profile_out(user)
             return {
                 "success": True,
                 "data": user_profile,
@@ -63,9 +80,9 @@ class UserProfileService:
     async def upload_user_avatar(db: Session, user: User, file: UploadFile) -> dict:
         """Upload user profile picture"""
         try:
-            # Delete old profile picture if exists
+            # Delete old profile picture if exists (off the event loop)
             if user.profile_picture_url:
-                delete_profile_picture(user.profile_picture_url)
+                await asyncio.to_thread(delete_profile_picture, user.profile_picture_url)
             
             # Upload new profile picture
             file_path = await upload_profile_picture(file)
@@ -75,7 +92,7 @@ class UserProfileService:
             db.commit()
             db.refresh(user)
             
-            user_profile = UserProfileOut.model_validate(user)
+            user_profile = _profile_out(user)
             return {
                 "success": True,
                 "data": user_profile,
@@ -112,20 +129,42 @@ class UserProfileService:
                 detail="Failed to remove profile picture"
             )
     
+    @staticmethod
+    def _ensure_preferences(db: Session, user: User, **defaults) -> UserPreferences:
+        """Return the user's preferences row, creating it if missing.
+
+        Concurrent first requests race on the unique ``user_id``; with
+        ``ON CONFLICT DO NOTHING`` the loser reads the winner's row instead
+        of failing on the constraint.
+        """
+        preferences = user.preferences
+        if preferences is not None:
+            return preferences
+
+        stmt = (
+            pg_insert(UserPreferences)
+            .values(user_id=user.id, **defaults)
+            .on_conflict_do_nothing(index_elements=[UserPreferences.user_id])
+            .returning(UserPreferences)
+        )
+        preferences = db.execute(stmt).scalar_one_or_none()
+        if preferences is None:
+            preferences = db.execute(
+                select(UserPreferences).where(UserPreferences.user_id == user.id)
+            ).scalar_one()
+        return preferences
+
     @staticmethod
     def get_user_preferences(db: Session, user: User) -> dict:
         """Get user preferences"""
-        preferences = db.query(UserPreferences).filter(UserPreferences.user_id == user.id).first()
+        preferences = user.preferences
         
         if not preferences:
             # Create default preferences if they don't exist
-            preferences = UserPreferences(
-                user_id=user.id,
-                **UserPreferencesBase().model_dump()
+            preferences = UserProfileService._ensure_preferences(
+                db, user, **UserPreferencesBase().model_dump()
             )
-            db.add(preferences)
             db.commit()
-            db.refresh(preferences)
         
         preferences_out = UserPreferencesOut.model_validate(preferences)
         return {
@@ -137,20 +176,11 @@ class UserProfileService:
     @staticmethod
     def update_user_preferences(db: Session, user: User, preferences_data: UserPreferencesUpdate) -> dict:
         """Update user preferences"""
-        preferences = db.query(UserPreferences).filter(UserPreferences.user_id == user.id).first()
-        
-        if not preferences:
-            # Create new preferences if they don't exist
-            preferences = UserPreferences(user_id=user.id)
-            db.add(preferences)
+        preferences = UserProfileService._ensure_preferences(db, user)
         
         # Update preferences fields
         update_data = preferences_data.model_dump(exclude_unset=True)
         
-        # Handle notification_settings JSON serialization
-        if "notification_settings" in update_data and update_data["notification_settings"]:
-            update_data["notification_settings"] = json.dumps(update_data["notification_settings"])
-        
         for field, value in update_data.items():
             setattr(preferences, field, value)
         
@@ -180,12 +210,12 @@ class UserProfileService:
                 delete_profile_picture(user.profile_picture_url)
             
             # Delete user preferences
-            preferences = db.query(UserPreferences).filter(UserPreferences.user_id == user.id).first()
+            preferences = user.preferences
             if preferences:
                 db.delete(preferences)
             
             # Delete user
-            user_data = UserProfileOut.model_validate(user)
+            user_data = _profile_out(user)
             db.delete(user)
             db.commit()
             
@@ -1,4 +1,9 @@
+from typing import Optional
+
+import orjson
 from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 
 
 class ResponseHandler:
@@ -37,3 +42,36 @@ class ResponseHandler:
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid {name} token.",
             headers={"WWW-Authenticate": "Bearer"})
+
+
+def _model_fields(value):
+    """orjson ``default`` hook: emit a constructed model's field values as-is."""
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    raise TypeError
+
+
+class ModelListResponse(ORJSONResponse):
+    """``ORJSONResponse`` that serializes pydantic models without ``model_dump``."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_model_fields, option=orjson.OPT_NON_STR_KEYS)
+
+
+def list_response(result: dict, message: Optional[str] = None) -> ModelListResponse:
+    """Serialize a list envelope directly with orjson.
+
+    Items are either ``*Out`` models built with ``model_construct`` from
+    trusted rows or JSON objects built by PostgreSQL, so this skips FastAPI's
+    response-model re-validation, ``jsonable_encoder`` and per-row
+    ``model_dump``; ``response_model`` is still used for the OpenAPI schema.
+    ``message`` overrides the envelope's message when the result has none.
+    """
+    content = {
+        "success": result.get("success", True),
+        "data": result["data"],
+        "message": message if message is not None else result["message"],
+    }
+    if "meta" in result:
+        content["meta"] = result["meta"]
+    return ModelListResponse(content=content)
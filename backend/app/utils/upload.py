@@ -1,132 +1,206 @@
 from fastapi import UploadFile, HTTPException
 from typing import List
+import asyncio
+import io
 import os
-import uuid
 import shutil
+from secrets import token_hex
+
+from app.core.config import settings
 
-# Create upload directories if they don't exist
 UPLOAD_DIR = "uploads/products"
 PROFILE_UPLOAD_DIR = "uploads/profiles"
 RECEIPTS_UPLOAD_DIR = "uploads/receipts"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-os.makedirs(PROFILE_UPLOAD_DIR, exist_ok=True)
-os.makedirs(RECEIPTS_UPLOAD_DIR, exist_ok=True)
+_dirs_ready = False
+
+# Public URL paths the saved files are served under
+UPLOAD_URL_PREFIX = "/uploads/products/"
+PROFILE_URL_PREFIX = "/uploads/profiles/"
+RECEIPTS_URL_PREFIX = "/uploads/receipts/"
 
 # Allowed image extensions
-ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp"}
+ALLOWED_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp"})
+_ALLOWED_EXTENSIONS_MESSAGE = f"Invalid file type. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+# Leading bytes of the allowed image formats (WebP is RIFF....WEBP)
+IMAGE_SIGNATURES = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")
+# Below this, sendfile's setup costs more than the buffered copy saves
+SENDFILE_MIN_BYTES = 1024 * 1024
 
 
-def validate_image(file: UploadFile) -> None:
-    """Validate uploaded image file"""
+def validate_image(file: UploadFile) -> str:
+    """Validate uploaded image file and return its lower-cased extension"""
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
     
-    file_extension = file.filename.split(".")[-1].lower()
+    file_extension = os.path.splitext(file.filename)[1][1:].lower()
     if file_extension not in ALLOWED_EXTENSIONS:
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
-        )
+        raise HTTPException(status_code=400, detail=_ALLOWED_EXTENSIONS_MESSAGE)
     
     # Check file size (this is approximate since we haven't read the whole file yet)
-    if hasattr(file, 'size') and file.size > MAX_FILE_SIZE:
+    if getattr(file, 'size', None) is not None and file.size > MAX_FILE_SIZE:
         raise HTTPException(status_code=400, detail="File too large. Maximum size is 5MB")
 
+    return file_extension
+
+
+def ensure_upload_dirs() -> None:
+    """Create the upload directories once per process.
+
+    Called from the app's startup hook and before each save, rather than at
+    import, so merely importing this module does no filesystem work.
+    """
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    for directory in (UPLOAD_DIR, PROFILE_UPLOAD_DIR, RECEIPTS_UPLOAD_DIR):
+        os.makedirs(directory, exist_ok=True)
+    _dirs_ready = True
+
+
+def _sendfile(source, dest) -> bool:
+    """Copy ``source`` into ``dest`` inside the kernel with ``os.sendfile``.
+
+    Only used once Starlette's spooled upload has rolled over to a real file
+    of at least ``SENDFILE_MIN_BYTES``. Returns ``False`` (with ``dest`` left
+    empty) when the caller should fall back to a buffered copy.
+    """
+    # fileno() would force an in-memory spool onto disk, so check first
+    if not hasattr(os, "sendfile") or not getattr(source, "_rolled", True):
+        return False
+    try:
+        src_fd = source.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return False
+
+    start = source.tell()
+    remaining = os.fstat(src_fd).st_size - start
+    if remaining < SENDFILE_MIN_BYTES:
+        return False
+
+    offset = start
+    try:
+        while remaining > 0:
+            sent = os.sendfile(dest.fileno(), src_fd, offset, remaining)
+            if sent == 0:
+                break
+            offset += sent
+            remaining -= sent
+    except OSError:
+        dest.seek(0)
+        dest.truncate()
+        return False
+    return True
+
+
+def _is_image(head: bytes) -> bool:
+    return head.startswith(IMAGE_SIGNATURES) or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+
+
+def _check_upload(source) -> None:
+    """Reject oversized or non-image uploads before anything is written.
+
+    ``validate_image`` can only trust ``UploadFile.size`` when the client
+    sent it; the spooled body itself is always measurable, so the limit is
+    enforced here too, along with a magic-byte check against spoofed
+    extensions.
+    """
+    start = source.tell()
+    size = source.seek(0, os.SEEK_END) - start
+    source.seek(start)
+    if size > MAX_FILE_SIZE:
+        raise HTTPException(status_code=400, detail="File too large. Maximum size is 5MB")
+
+    head = source.read(12)
+    source.seek(start)
+    if not _is_image(head):
+        raise HTTPException(status_code=400, detail="File content is not a supported image")
+
+
+def _copy_to_disk(source, file_path: str) -> None:
+    _check_upload(source)
+    with open(file_path, "wb") as buffer:
+        if not _sendfile(source, buffer):
+            shutil.copyfileobj(source, buffer, settings.upload_copy_buffer_bytes)
+
+
+async def _save_upload(file: UploadFile, file_extension: str, dest_dir: str, url_prefix: str) -> str:
+    """Save ``file`` under ``dest_dir`` and return its public URL path.
+
+    The copy runs in a worker thread so concurrent uploads don't block the
+    event loop while the file is written.
+    """
+    ensure_upload_dirs()
+    file_name = f"{token_hex(16)}.{file_extension}"
+    file_path = os.path.join(dest_dir, file_name)
+
+    await asyncio.to_thread(_copy_to_disk, file.file, file_path)
+    return f"{url_prefix}{file_name}"
+
+
+def _delete_upload(file_path: str, url_prefix: str, dest_dir: str) -> bool:
+    """Delete the file behind a public upload path; a missing file is fine.
+
+    Removing directly and handling ``FileNotFoundError`` saves the separate
+    existence check and its race with concurrent deletes.
+    """
+    if not file_path or not file_path.startswith(url_prefix):
+        return True
+    try:
+        os.remove(os.path.join(dest_dir, os.path.basename(file_path)))
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return False
+    return True
+
 
 async def upload_profile_picture(file: UploadFile) -> str:
     """Upload profile picture and return the file path"""
-    validate_image(file)
-    
-    file_extension = file.filename.split(".")[-1].lower()
-    file_name = f"{uuid.uuid4()}.{file_extension}"
-    file_path = os.path.join(PROFILE_UPLOAD_DIR, file_name)
-    
-    # Save file to local directory
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    file_extension = validate_image(file)
     
     # Return relative path that will be stored in database
-    return f"/uploads/profiles/{file_name}"
+    return await _save_upload(file, file_extension, PROFILE_UPLOAD_DIR, PROFILE_URL_PREFIX)
 
 
 def delete_profile_picture(file_path: str) -> bool:
     """Delete profile picture file"""
-    if not file_path:
-        return True
-    
-    # Convert relative path to absolute path
-    if file_path.startswith("/uploads/profiles/"):
-        file_name = file_path.split("/")[-1]
-        absolute_path = os.path.join(PROFILE_UPLOAD_DIR, file_name)
-        
-        if os.path.exists(absolute_path):
-            try:
-                os.remove(absolute_path)
-                return True
-            except OSError:
-                return False
-    
-    return True
+    return _delete_upload(file_path, PROFILE_URL_PREFIX, PROFILE_UPLOAD_DIR)
 
 
 async def upload_image(file: UploadFile) -> str:
     """Upload product image and return the file path"""
-    validate_image(file)
-    
-    file_extension = file.filename.split(".")[-1].lower()
-    file_name = f"{uuid.uuid4()}.{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, file_name)
-    
-    # Save file to local directory
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    file_extension = validate_image(file)
     
     # Return relative path that will be stored in database
-    return f"/uploads/products/{file_name}"
+    return await _save_upload(file, file_extension, UPLOAD_DIR, UPLOAD_URL_PREFIX)
 
 
 async def upload_multiple_images(files: List[UploadFile]) -> List[str]:
-    urls = []
-    for file in files:
-        url = await upload_image(file)
-        urls.append(url)
+    # Validate everything up front so a bad file doesn't leave earlier ones saved
+    extensions = [validate_image(file) for file in files]
+
+    # Bound the number of worker threads a single request can occupy
+    semaphore = asyncio.Semaphore(settings.upload_concurrency)
+
+    async def _upload_one(file: UploadFile, file_extension: str) -> str:
+        async with semaphore:
+            return await _save_upload(file, file_extension, UPLOAD_DIR, UPLOAD_URL_PREFIX)
+
+    urls = await asyncio.gather(*(_upload_one(file, ext) for file, ext in zip(files, extensions)))
 
     # Return list relative paths that will be stored in database
-    return urls
+    return list(urls)
 
 
 async def upload_receipt_image(file: UploadFile) -> str:
     """Upload receipt image and return the file path"""
-    validate_image(file)
-    
-    file_extension = file.filename.split(".")[-1].lower()
-    file_name = f"{uuid.uuid4()}.{file_extension}"
-    file_path = os.path.join(RECEIPTS_UPLOAD_DIR, file_name)
-    
-    # Save file to local directory
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    file_extension = validate_image(file)
     
     # Return relative path that will be stored in database
-    return f"/uploads/receipts/{file_name}"
+    return await _save_upload(file, file_extension, RECEIPTS_UPLOAD_DIR, RECEIPTS_URL_PREFIX)
 
 
 def delete_receipt_image(file_path: str) -> bool:
     """Delete receipt image file"""
-    if not file_path:
-        return True
-    
-    # Convert relative path to absolute path
-    if file_path.startswith("/uploads/receipts/"):
-        file_name = file_path.split("/")[-1]
-        absolute_path = os.path.join(RECEIPTS_UPLOAD_DIR, file_name)
-        
-        if os.path.exists(absolute_path):
-            try:
-                os.remove(absolute_path)
-                return True
-            except OSError:
-                return False
-    
-    return True
\ No newline at end of file
+    return _delete_upload(file_path, RECEIPTS_URL_PREFIX, RECEIPTS_UPLOAD_DIR)
\ No newline at end of file
@@ -0,0 +1,74 @@
+-- =====================================================
+-- Migration: Expense monthly rollup
+-- Description: Maintains per-user, per-month, per-category totals so the
+--              category and monthly summaries read a handful of rows
+--              instead of aggregating the raw expenses table.
+--              Enable EXPENSE_ROLLUP_ENABLED once this has been applied.
+-- =====================================================
+
+-- =====================================================
+-- EXPENSE ROLLUP TABLE
+-- =====================================================
+CREATE TABLE IF NOT EXISTS expense_rollup (
+  user_id uuid NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  month date NOT NULL,
+  category expense_categories NOT NULL,
+  total_amount double precision NOT NULL DEFAULT 0,
+  transaction_count integer NOT NULL DEFAULT 0,
+  PRIMARY KEY (user_id, month, category)
+);
+
+-- =====================================================
+-- MAINTENANCE TRIGGER
+-- Applies every INSERT/UPDATE/DELETE on expenses as a delta, including
+-- bulk and RETURNING statements issued outside the ORM
+-- =====================================================
+CREATE OR REPLACE FUNCTION expense_rollup_apply(
+  p_user_id uuid,
+  p_date timestamptz,
+  p_category expense_categories,
+  p_amount double precision,
+  p_count integer
+) RETURNS void AS $$
+BEGIN
+  INSERT INTO expense_rollup AS r (user_id, month, category, total_amount, transaction_count)
+  VALUES (p_user_id, date_trunc('month', p_date)::date, p_category, p_amount, p_count)
+  ON CONFLICT (user_id, month, category) DO UPDATE
+  SET total_amount = r.total_amount + EXCLUDED.total_amount,
+      transaction_count = r.transaction_count + EXCLUDED.transaction_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION expense_rollup_trigger() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM expense_rollup_apply(OLD.user_id, OLD.date, OLD.category, -OLD.amount, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM expense_rollup_apply(NEW.user_id, NEW.date, NEW.category, NEW.amount, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- BACKFILL
+-- Rebuilds the rollup from scratch; safe to re-run
+-- =====================================================
+BEGIN;
+
+LOCK TABLE expenses IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS expenses_rollup ON expenses;
+CREATE TRIGGER expenses_rollup
+AFTER INSERT OR DELETE OR UPDATE OF user_id, date, category, amount ON expenses
+FOR EACH ROW EXECUTE FUNCTION expense_rollup_trigger();
+
+TRUNCATE expense_rollup;
+
+INSERT INTO expense_rollup (user_id, month, category, total_amount, transaction_count)
+SELECT user_id, date_trunc('month', date)::date, category, SUM(amount), COUNT(*)
+FROM expenses
+GROUP BY 1, 2, 3;
+
+COMMIT;
@@ -0,0 +1,60 @@
+-- =====================================================
+-- Migration: Materialized last journal entry per user
+-- Description: Keeps users.last_journal_at equal to the user's latest
+--              journal_entries.created_at so the daily summary reads it
+--              with a primary-key lookup instead of scanning entries.
+-- =====================================================
+
+ALTER TABLE users
+ADD COLUMN IF NOT EXISTS last_journal_at timestamp with time zone;
+
+-- =====================================================
+-- MAINTENANCE TRIGGER
+-- Recomputes the owner's latest entry (an index descent on
+-- idx_journal_entries_user_created) after every insert, delete or move
+-- =====================================================
+CREATE OR REPLACE FUNCTION journal_last_entry_refresh(p_user_id uuid) RETURNS void AS $$
+BEGIN
+  UPDATE users
+  SET last_journal_at = (
+    SELECT max(created_at) FROM journal_entries WHERE user_id = p_user_id
+  )
+  WHERE id = p_user_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION journal_last_entry_trigger() RETURNS trigger AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM journal_last_entry_refresh(OLD.user_id);
+  END IF;
+  IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND NEW.user_id IS DISTINCT FROM OLD.user_id) THEN
+    PERFORM journal_last_entry_refresh(NEW.user_id);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- =====================================================
+-- BACKFILL
+-- Safe to re-run
+-- =====================================================
+BEGIN;
+
+LOCK TABLE journal_entries IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER IF EXISTS journal_entries_last_entry ON journal_entries;
+CREATE TRIGGER journal_entries_last_entry
+AFTER INSERT OR DELETE OR UPDATE OF user_id, created_at ON journal_entries
+FOR EACH ROW EXECUTE FUNCTION journal_last_entry_trigger();
+
+UPDATE users u
+SET last_journal_at = j.last_journal_at
+FROM (
+  SELECT user_id, max(created_at) AS last_journal_at
+  FROM journal_entries
+  GROUP BY user_id
+) j
+WHERE u.id = j.user_id;
+
+COMMIT;
@@ -0,0 +1,15 @@
+-- =====================================================
+-- Migration: Notification settings as JSONB objects
+-- Description: user_preferences.notification_settings is now written as a
+--              JSONB object. Convert any legacy text column and unwrap rows
+--              that stored the JSON document as a quoted string.
+-- =====================================================
+
+-- No-op when the column is already jsonb (as created by setup_database.sql)
+ALTER TABLE user_preferences
+ALTER COLUMN notification_settings TYPE jsonb USING notification_settings::jsonb;
+
+-- '"{\"email_enabled\": true}"' -> '{"email_enabled": true}'
+UPDATE user_preferences
+SET notification_settings = (notification_settings #>> '{}')::jsonb
+WHERE jsonb_typeof(notification_settings) = 'string';
@@ -0,0 +1,141 @@
+-- =====================================================
+-- Migration: Query performance indexes
+-- Description: Indexes backing the hot list/filter queries in the API
+-- =====================================================
+
+-- =====================================================
+-- EVENTS
+-- =====================================================
+
+-- GIN index for the tag filter (tags ?| ARRAY[...]) on the events list
+CREATE INDEX IF NOT EXISTS idx_events_tags
+ON events USING GIN (tags);
+
+-- Daily summary: today's and next week's events by start_time range
+CREATE INDEX IF NOT EXISTS idx_events_user_start
+ON events(user_id, start_time);
+
+-- =====================================================
+-- TASKS
+-- =====================================================
+
+-- Task list sort key and keyset seek: due_date (missing last), priority rank,
+-- created_at, id; the expressions must match TaskRepository.list_tasks
+CREATE INDEX IF NOT EXISTS idx_tasks_user_list_key
+ON tasks(
+  user_id,
+  coalesce(due_date, '-infinity'::timestamptz) DESC,
+  (CASE WHEN priority = 'high' THEN 2 WHEN priority = 'medium' THEN 1 ELSE 0 END) DESC,
+  created_at DESC,
+  id DESC
+);
+
+-- tasks.tags is filtered with tags ?| ARRAY[...]; convert any legacy text
+-- column (a no-op when the column is already jsonb)
+ALTER TABLE tasks ALTER COLUMN tags TYPE jsonb USING tags::jsonb;
+
+-- GIN index for the tag filter on the task list
+CREATE INDEX IF NOT EXISTS idx_tasks_tags
+ON tasks USING GIN (tags);
+
+-- Today/overdue listings and the due-date filter: due_date range per user
+CREATE INDEX IF NOT EXISTS idx_tasks_user_due
+ON tasks(user_id, due_date);
+
+-- Today/overdue listings only read open tasks (status <> 'completed')
+CREATE INDEX IF NOT EXISTS idx_tasks_user_open_due
+ON tasks(user_id, due_date)
+WHERE status <> 'completed';
+
+-- Daily summary: open task counts by status and due_date range
+CREATE INDEX IF NOT EXISTS idx_tasks_user_status_due
+ON tasks(user_id, status, due_date);
+
+-- Daily summary: tasks completed today
+CREATE INDEX IF NOT EXISTS idx_tasks_user_completion
+ON tasks(user_id, completion_date)
+WHERE status = 'completed';
+
+-- =====================================================
+-- EXPENSES
+-- =====================================================
+
+-- expenses.tags is mapped as JSONB in the ORM; convert any legacy text column
+-- (a no-op when the column is already jsonb)
+ALTER TABLE expenses ALTER COLUMN tags TYPE jsonb USING tags::jsonb;
+
+-- GIN index for tag containment/existence queries on expenses
+CREATE INDEX IF NOT EXISTS idx_expenses_tags
+ON expenses USING GIN (tags);
+
+-- List, summary and export queries filter on user_id plus a date range and
+-- order by date DESC
+CREATE INDEX IF NOT EXISTS idx_expenses_user_date
+ON expenses(user_id, date DESC);
+
+-- Category-filtered list and breakdown queries
+CREATE INDEX IF NOT EXISTS idx_expenses_user_category_date
+ON expenses(user_id, category, date DESC);
+
+-- Recurring expenses listing
+CREATE INDEX IF NOT EXISTS idx_expenses_user_recurring
+ON expenses(user_id, date DESC)
+WHERE is_recurring = TRUE;
+
+-- Trigram indexes for the ilike('%search%') filter, which a btree cannot serve
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_expenses_description_trgm
+ON expenses USING GIN (description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_expenses_merchant_trgm
+ON expenses USING GIN (merchant gin_trgm_ops);
+
+-- Generated full-text document for the list search (description, merchant,
+-- subcategory), probed with to_tsquery instead of three ilike scans
+ALTER TABLE expenses
+ADD COLUMN IF NOT EXISTS search_doc tsvector
+GENERATED ALWAYS AS (
+  to_tsvector('simple', coalesce(description, '') || ' ' ||
+                        coalesce(merchant, '') || ' ' ||
+                        coalesce(subcategory, ''))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_expenses_search_doc
+ON expenses USING GIN (search_doc);
+
+-- Covering index for the dashboard aggregates (totals, category breakdown
+-- and trend): range on date, group by category, sum amount, all index-only
+CREATE INDEX IF NOT EXISTS idx_expenses_user_date_category
+ON expenses(user_id, date, category) INCLUDE (amount);
+
+-- =====================================================
+-- USER PREFERENCES
+-- =====================================================
+
+-- Daily email batch: users who opted in to the summary email
+CREATE INDEX IF NOT EXISTS idx_user_preferences_email_enabled
+ON user_preferences(user_id)
+WHERE (notification_settings->>'email_enabled') = 'true';
+
+-- =====================================================
+-- JOURNAL ENTRIES
+-- =====================================================
+
+-- Entry listing, stats and mood trends filter on user_id plus a created_at
+-- range and order by created_at
+CREATE INDEX IF NOT EXISTS idx_journal_entries_user_created
+ON journal_entries(user_id, created_at DESC);
+
+-- Generated full-text document for the entry search (title, content,
+-- summary), probed with to_tsquery instead of three ilike scans
+ALTER TABLE journal_entries
+ADD COLUMN IF NOT EXISTS search_doc tsvector
+GENERATED ALWAYS AS (
+  to_tsvector('english', coalesce(title, '') || ' ' ||
+                         coalesce(content, '') || ' ' ||
+                         coalesce(summary, ''))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_journal_entries_search_doc
+ON journal_entries USING GIN (search_doc);
@@ -46,7 +46,7 @@ export function ExpenseList({ onEdit, onDelete }: ExpenseListProps) {
         setLoading(true);
       }
       setError(null);
-      const response = await getExpenses({ page, limit });
+      const response = await getExpenses({ page, limit, include_total: true });
       setExpenses(response.data);
       if (response.meta) {
         setTotalPages(response.meta.pages || 1);
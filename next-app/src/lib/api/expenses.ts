@@ -414,12 +414,19 @@ export interface ExportParams {
 /**
  * Export expenses to CSV or JSON
  * @param params - Export format and date range
- * @returns Exported data as string (CSV) or array (JSON)
+ * @returns Raw CSV text (streamed as text/csv) or the JSON response envelope
  */
 export async function exportExpenses(
   params?: ExportParams
-): Promise<ApiResponse<string | Expense[]>> {
-  const response = await apiClient.get<ApiResponse<string | Expense[]>>(
+): Promise<string | ApiResponse<Expense[]>> {
+  if ((params?.format ?? 'csv') === 'csv') {
+    const response = await apiClient.get<string>('/expenses/export', {
+      params,
+      responseType: 'text',
+    });
+    return response.data;
+  }
+  const response = await apiClient.get<ApiResponse<Expense[]>>(
     '/expenses/export',
     { params }
   );
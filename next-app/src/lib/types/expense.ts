@@ -62,6 +62,7 @@ export interface ExpenseFilters {
   end_date?: string;
   page?: number;
   limit?: number;
+  include_total?: boolean;
 }
 
 export interface AIParsedExpense {